@@ -14,6 +14,7 @@ Conversion Algorithms:
 - Postfix ↔ Prefix: Via Infix as intermediate
 """
 
+import functools
 from typing import List, Tuple, Optional
 from dataclasses import dataclass
 from expression_validator import (
@@ -628,3 +629,18 @@ def prefix_to_postfix(expression: str) -> str:
     result = ExpressionConverter().prefix_to_postfix(expression)
     return result.result_expression if result.success else ""
 
+
+@functools.lru_cache(maxsize=128)
+def convert_to_all_notations(expression: str,
+                             source: NotationType) -> Tuple[str, str, str]:
+    """
+    Convert expression to (infix, postfix, prefix), memoized.
+    
+    Conversions are pure, so repeated requests for the same expression
+    (e.g. clicking an example again) are answered from the cache.
+    """
+    results = ExpressionConverter().convert_to_all(expression, source)
+    return (results[NotationType.INFIX].result_expression,
+            results[NotationType.POSTFIX].result_expression,
+            results[NotationType.PREFIX].result_expression)
+
@@ -9,11 +9,127 @@ This module provides validators for mathematical expressions in different notati
 Each validator uses a specialized PDA configuration for the specific notation.
 """
 
+import sys
 from typing import Tuple, List, Optional, Dict
 from dataclasses import dataclass
 from enum import Enum, auto
 from pushdown_automata import PushdownAutomata, StateType, PDAConfiguration
 
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    # Numba (and numpy) are optional; the verdict-only loops below then run
+    # as plain Python
+    np = None
+    njit = None
+
+
+# Token classes and state names compared in the validation loops. They are
+# interned so the checks below can compare by identity instead of by value.
+_OPERAND = sys.intern("OPERAND")
+_OPERATOR = sys.intern("OPERATOR")
+_LPAREN = sys.intern("LPAREN")
+_RPAREN = sys.intern("RPAREN")
+_INVALID = sys.intern("INVALID")
+_Q_ERROR = sys.intern("q_error")
+_Q_EXPECT_OPERATOR = sys.intern("q_expect_operator")
+
+
+# Integer codes used by the verdict-only validation loops
+_TOKEN_CODES = {_OPERAND: 0, _OPERATOR: 1, _LPAREN: 2, _RPAREN: 3, _INVALID: 4}
+_CODE_OPERAND, _CODE_OPERATOR, _CODE_LPAREN, _CODE_RPAREN, _CODE_INVALID = range(5)
+# Stack actions in a compiled transition row
+_ACTION_NONE, _ACTION_PUSH, _ACTION_POP, _ACTION_REPLACE = range(4)
+
+
+def _run_pda(tokens, transitions, initial_state, stack):
+    """
+    Run a compiled PDA over integer-coded tokens.
+    
+    Each transition row is (from_state, input, stack_top, action, symbol,
+    to_state), where input and stack_top are -1 for "any"; the first
+    matching row wins, as in PushdownAutomata._find_transition. stack is a
+    scratch buffer of at least len(tokens) + 1 entries.
+    
+    Returns:
+        (final_state, stack_size) with final_state -1 if no transition
+        applied; stack_size excludes the bottom marker
+    """
+    state = initial_state
+    stack[0] = 0
+    top = 0
+    for token in tokens:
+        match = -1
+        for r in range(len(transitions)):
+            row = transitions[r]
+            if (row[0] == state
+                    and (row[1] == -1 or row[1] == token)
+                    and (row[2] == -1 or row[2] == stack[top])):
+                match = r
+                break
+        if match == -1:
+            return -1, top
+        row = transitions[match]
+        action = row[3]
+        if action == _ACTION_PUSH:
+            top += 1
+            stack[top] = row[4]
+        elif action == _ACTION_POP:
+            if top == 0:
+                return -1, top
+            top -= 1
+        elif action == _ACTION_REPLACE:
+            # Replacing on an empty stack just pushes
+            if top == 0:
+                top = 1
+            stack[top] = row[4]
+        state = row[5]
+    return state, top
+
+
+def _count_operands(tokens):
+    """
+    Run the postfix operand counter over integer-coded tokens.
+    
+    Returns the final operand count, or -1 as soon as a token is rejected.
+    Prefix expressions use the same loop on the reversed tokens.
+    """
+    count = 0
+    for token in tokens:
+        if token == _CODE_OPERAND:
+            count += 1
+        elif token == _CODE_OPERATOR:
+            if count < 2:
+                return -1
+            count -= 1
+        else:
+            return -1
+    return count
+
+
+if njit is not None:
+    # Explicit signatures compile at import; cache=True keeps the machine
+    # code on disk between runs
+    _run_pda = njit("UniTuple(int64, 2)(int32[::1], int32[:, ::1], int64, int32[::1])",
+                    cache=True)(_run_pda)
+    _count_operands = njit("int64(int32[::1])", cache=True)(_count_operands)
+
+
+def _encode_tokens(tokens: List[str]):
+    """Classify tokens into the integer codes used by the fast loops."""
+    codes = [_TOKEN_CODES[ExpressionTokenizer.classify_token(token)] for token in tokens]
+    if np is not None:
+        return np.array(codes, dtype=np.int32)
+    return codes
+
+
+def _stack_buffer(size: int):
+    """Allocate a scratch stack for _run_pda."""
+    if np is not None:
+        return np.zeros(size, dtype=np.int32)
+    return [0] * size
+
 
 class NotationType(Enum):
     """Types of mathematical notation."""
@@ -34,6 +150,9 @@ class ValidationResult:
         execution_trace: Step-by-step execution history
         final_state: Name of the final state
     """
+    # Explicit slots (dataclass(slots=True) needs Python 3.10+)
+    __slots__ = ('is_valid', 'notation', 'message', 'execution_trace', 'final_state')
+
     is_valid: bool
     notation: NotationType
     message: str
@@ -97,16 +216,17 @@ class ExpressionTokenizer:
         
         Expects space-separated tokens: 3 4 + 2 *
         """
-        tokens = []
-        for token in expression.split():
-            token = token.strip()
-            if token:
-                if token in ExpressionTokenizer.OPERATORS:
-                    tokens.append(token)
-                elif token.isdigit():
-                    tokens.append(token)
-                else:
-                    tokens.append(f"INVALID:{token}")
+        # split() yields exactly one non-empty token per part, so the
+        # result list can be sized up front
+        parts = expression.split()
+        tokens = [None] * len(parts)
+        for i, token in enumerate(parts):
+            if token in ExpressionTokenizer.OPERATORS:
+                tokens[i] = token
+            elif token.isdigit():
+                tokens[i] = token
+            else:
+                tokens[i] = f"INVALID:{token}"
         return tokens
     
     @staticmethod
@@ -132,16 +252,16 @@ class ExpressionTokenizer:
             'INVALID' for unrecognized tokens
         """
         if token.startswith("INVALID:"):
-            return "INVALID"
+            return _INVALID
         if token in ExpressionTokenizer.OPERATORS:
-            return "OPERATOR"
+            return _OPERATOR
         if token == "(":
-            return "LPAREN"
+            return _LPAREN
         if token == ")":
-            return "RPAREN"
+            return _RPAREN
         if token.isdigit():
-            return "OPERAND"
-        return "INVALID"
+            return _OPERAND
+        return _INVALID
 
 
 class InfixValidator:
@@ -166,36 +286,74 @@ class InfixValidator:
                           "Initial state - expecting operand or '('")
         self.pda.add_state("q_expect_operand", StateType.NORMAL,
                           "Expecting an operand (number) or '('")
-        self.pda.add_state("q_expect_operator", StateType.NORMAL,
+        self.pda.add_state(_Q_EXPECT_OPERATOR, StateType.NORMAL,
                           "Expecting an operator or ')' or end")
         self.pda.add_state("q_accept", StateType.ACCEPTING,
                           "Expression accepted")
-        self.pda.add_state("q_error", StateType.ERROR,
+        self.pda.add_state(_Q_ERROR, StateType.ERROR,
                           "Invalid expression")
         
         # Transitions from q_start
-        self.pda.add_transition("q_start", "q_expect_operator", 
-                               "OPERAND", None, "none",
+        self.pda.add_transition("q_start", _Q_EXPECT_OPERATOR, 
+                               _OPERAND, None, "none",
                                "Read operand, expect operator next")
         self.pda.add_transition("q_start", "q_expect_operand",
-                               "LPAREN", None, "push:(",
+                               _LPAREN, None, "push:(",
                                "Read '(', push to stack, expect operand")
         
         # Transitions from q_expect_operand  
-        self.pda.add_transition("q_expect_operand", "q_expect_operator",
-                               "OPERAND", None, "none",
+        self.pda.add_transition("q_expect_operand", _Q_EXPECT_OPERATOR,
+                               _OPERAND, None, "none",
                                "Read operand, expect operator next")
         self.pda.add_transition("q_expect_operand", "q_expect_operand",
-                               "LPAREN", None, "push:(",
+                               _LPAREN, None, "push:(",
                                "Read '(', push to stack, still expect operand")
         
         # Transitions from q_expect_operator
-        self.pda.add_transition("q_expect_operator", "q_expect_operand",
-                               "OPERATOR", None, "none",
+        self.pda.add_transition(_Q_EXPECT_OPERATOR, "q_expect_operand",
+                               _OPERATOR, None, "none",
                                "Read operator, expect operand next")
-        self.pda.add_transition("q_expect_operator", "q_expect_operator",
-                               "RPAREN", "(", "pop",
+        self.pda.add_transition(_Q_EXPECT_OPERATOR, _Q_EXPECT_OPERATOR,
+                               _RPAREN, "(", "pop",
                                "Read ')', pop matching '(' from stack")
+        
+        self._compile()
+    
+    def _compile(self) -> None:
+        """Encode the PDA's transitions as integer rows for _run_pda."""
+        state_index = {name: i for i, name in enumerate(self.pda.states)}
+        stack_codes = {"Z0": 0}
+        rows = []
+        for t in self.pda.transitions:
+            action, _, symbol = t.stack_action.partition(":")
+            symbol_code = stack_codes.setdefault(symbol, len(stack_codes)) if symbol else 0
+            rows.append((
+                state_index[t.from_state.name],
+                -1 if t.input_symbol is None else _TOKEN_CODES[t.input_symbol],
+                -1 if t.stack_top is None else stack_codes.setdefault(t.stack_top, len(stack_codes)),
+                {"none": _ACTION_NONE, "push": _ACTION_PUSH,
+                 "pop": _ACTION_POP, "replace": _ACTION_REPLACE}[action],
+                symbol_code,
+                state_index[t.to_state.name],
+            ))
+        self._transition_table = (np.array(rows, dtype=np.int32) if np is not None
+                                  else tuple(rows))
+        self._initial_state = state_index[self.pda.initial_state.name]
+        self._accept_state = state_index[_Q_EXPECT_OPERATOR]
+    
+    def validate_fast(self, expression: str) -> bool:
+        """
+        Check whether an infix expression is valid, without building a trace.
+        
+        Runs the same PDA as validate() over integer-coded tokens, compiled
+        with Numba when it is installed.
+        """
+        tokens = _encode_tokens(ExpressionTokenizer.tokenize_infix(expression))
+        if len(tokens) == 0:
+            return False
+        state, stack_size = _run_pda(tokens, self._transition_table,
+                                     self._initial_state, _stack_buffer(len(tokens) + 1))
+        return state == self._accept_state and stack_size == 0
     
     def validate(self, expression: str) -> ValidationResult:
         """
@@ -204,12 +362,23 @@ class InfixValidator:
         Args:
             expression: The infix expression to validate
             
+        Returns:
+            ValidationResult with validation details
+        """
+        return self.validate_tokens(ExpressionTokenizer.tokenize_infix(expression))
+    
+    def validate_tokens(self, tokens: List[str]) -> ValidationResult:
+        """
+        Validate an already tokenized infix expression.
+        
+        Args:
+            tokens: Tokens produced by ExpressionTokenizer.tokenize_infix
+            
         Returns:
             ValidationResult with validation details
         """
         self.pda.reset()
-        tokens = ExpressionTokenizer.tokenize_infix(expression)
-        execution_trace = []
+        execution_trace = [None] * len(tokens)
         
         if not tokens:
             return ValidationResult(
@@ -217,28 +386,34 @@ class InfixValidator:
                 notation=NotationType.INFIX,
                 message="Empty expression",
                 execution_trace=["No tokens to process"],
-                final_state="q_error"
+                final_state=_Q_ERROR
             )
         
-        for token in tokens:
+        for i, token in enumerate(tokens):
             token_type = ExpressionTokenizer.classify_token(token)
             
-            if token_type == "INVALID":
+            if token_type is _INVALID:
+                del execution_trace[i:]
                 return ValidationResult(
                     is_valid=False,
                     notation=NotationType.INFIX,
                     message=f"Invalid token: {token}",
                     execution_trace=execution_trace,
-                    final_state="q_error"
+                    final_state=_Q_ERROR
                 )
             
-            config_before = self.pda.get_current_configuration()
+            state_before = self.pda.current_state.name
             success, error = self.pda.step(token_type)
             
-            trace_entry = f"Token: '{token}' ({token_type}) | State: {config_before.state.name} → {self.pda.current_state.name} | Stack: {self.pda.stack.get_contents()}"
-            execution_trace.append(trace_entry)
+            trace_entry = ''.join((
+                "Token: '", token, "' (", token_type, ") | State: ",
+                state_before, " → ", self.pda.current_state.name,
+                " | Stack: ", str(self.pda.stack.get_contents())
+            ))
+            execution_trace[i] = trace_entry
             
             if not success:
+                del execution_trace[i + 1:]
                 return ValidationResult(
                     is_valid=False,
                     notation=NotationType.INFIX,
@@ -251,7 +426,7 @@ class InfixValidator:
         final_state = self.pda.current_state.name
         stack_empty = self.pda.stack.is_empty()
         
-        if final_state == "q_expect_operator" and stack_empty:
+        if final_state is _Q_EXPECT_OPERATOR and stack_empty:
             return ValidationResult(
                 is_valid=True,
                 notation=NotationType.INFIX,
@@ -305,15 +480,15 @@ class PostfixValidator:
                           "Processing tokens")
         self.pda.add_state("q_accept", StateType.ACCEPTING,
                           "Expression accepted")
-        self.pda.add_state("q_error", StateType.ERROR,
+        self.pda.add_state(_Q_ERROR, StateType.ERROR,
                           "Invalid expression")
         
         # Transitions for operands - push marker to stack
         self.pda.add_transition("q_start", "q_processing",
-                               "OPERAND", None, "push:X",
+                               _OPERAND, None, "push:X",
                                "Read first operand, push marker")
         self.pda.add_transition("q_processing", "q_processing",
-                               "OPERAND", None, "push:X",
+                               _OPERAND, None, "push:X",
                                "Read operand, push marker")
         
         # Transitions for operators - pop 2, push 1 (net effect: pop 1)
@@ -328,12 +503,23 @@ class PostfixValidator:
         Args:
             expression: The postfix expression to validate (space-separated)
             
+        Returns:
+            ValidationResult with validation details
+        """
+        return self.validate_tokens(ExpressionTokenizer.tokenize_postfix(expression))
+    
+    def validate_tokens(self, tokens: List[str]) -> ValidationResult:
+        """
+        Validate an already tokenized postfix expression.
+        
+        Args:
+            tokens: Tokens produced by ExpressionTokenizer.tokenize_postfix
+            
         Returns:
             ValidationResult with validation details
         """
         self.pda.reset()
-        tokens = ExpressionTokenizer.tokenize_postfix(expression)
-        execution_trace = []
+        execution_trace = [None] * len(tokens)
         
         if not tokens:
             return ValidationResult(
@@ -341,7 +527,7 @@ class PostfixValidator:
                 notation=NotationType.POSTFIX,
                 message="Empty expression",
                 execution_trace=["No tokens to process"],
-                final_state="q_error"
+                final_state=_Q_ERROR
             )
         
         # Track operand count using stack simulation
@@ -350,44 +536,53 @@ class PostfixValidator:
         for i, token in enumerate(tokens):
             token_type = ExpressionTokenizer.classify_token(token)
             
-            if token_type == "INVALID":
+            if token_type is _INVALID:
+                del execution_trace[i:]
                 return ValidationResult(
                     is_valid=False,
                     notation=NotationType.POSTFIX,
                     message=f"Invalid token: {token}",
                     execution_trace=execution_trace,
-                    final_state="q_error"
+                    final_state=_Q_ERROR
                 )
             
-            if token_type == "LPAREN" or token_type == "RPAREN":
+            if token_type is _LPAREN or token_type is _RPAREN:
+                del execution_trace[i:]
                 return ValidationResult(
                     is_valid=False,
                     notation=NotationType.POSTFIX,
                     message="Parentheses not allowed in postfix notation",
                     execution_trace=execution_trace,
-                    final_state="q_error"
+                    final_state=_Q_ERROR
                 )
             
             state_before = "q_start" if i == 0 else "q_processing"
             
-            if token_type == "OPERAND":
+            if token_type is _OPERAND:
                 operand_count += 1
                 self.pda.stack.push("X")
-                trace_entry = f"Token: '{token}' (OPERAND) | Operands: {operand_count} | Stack: {self.pda.stack.get_contents()}"
+                trace_entry = ''.join((
+                    "Token: '", token, "' (OPERAND) | Operands: ", str(operand_count),
+                    " | Stack: ", str(self.pda.stack.get_contents())
+                ))
             else:  # OPERATOR
                 if operand_count < 2:
+                    del execution_trace[i:]
                     return ValidationResult(
                         is_valid=False,
                         notation=NotationType.POSTFIX,
                         message=f"Not enough operands for operator '{token}'",
                         execution_trace=execution_trace,
-                        final_state="q_error"
+                        final_state=_Q_ERROR
                     )
                 operand_count -= 1  # Two operands become one result
                 self.pda.stack.pop()
-                trace_entry = f"Token: '{token}' (OPERATOR) | Operands: {operand_count} | Stack: {self.pda.stack.get_contents()}"
+                trace_entry = ''.join((
+                    "Token: '", token, "' (OPERATOR) | Operands: ", str(operand_count),
+                    " | Stack: ", str(self.pda.stack.get_contents())
+                ))
             
-            execution_trace.append(trace_entry)
+            execution_trace[i] = trace_entry
         
         # Check final condition: exactly one operand remaining
         if operand_count == 1:
@@ -404,7 +599,7 @@ class PostfixValidator:
                 notation=NotationType.POSTFIX,
                 message=f"Too many operands ({operand_count}) - missing operators",
                 execution_trace=execution_trace,
-                final_state="q_error"
+                final_state=_Q_ERROR
             )
         else:
             return ValidationResult(
@@ -412,9 +607,14 @@ class PostfixValidator:
                 notation=NotationType.POSTFIX,
                 message="No result - expression is incomplete",
                 execution_trace=execution_trace,
-                final_state="q_error"
+                final_state=_Q_ERROR
             )
     
+    def validate_fast(self, expression: str) -> bool:
+        """Check whether a postfix expression is valid, without building a trace."""
+        return _count_operands(_encode_tokens(
+            ExpressionTokenizer.tokenize_postfix(expression))) == 1
+    
     def get_pda(self) -> PushdownAutomata:
         """Return the underlying PDA for diagram generation."""
         return self.pda
@@ -444,7 +644,7 @@ class PrefixValidator:
                           "Processing tokens right-to-left")
         self.pda.add_state("q_accept", StateType.ACCEPTING,
                           "Expression accepted")
-        self.pda.add_state("q_error", StateType.ERROR,
+        self.pda.add_state(_Q_ERROR, StateType.ERROR,
                           "Invalid expression")
     
     def validate(self, expression: str) -> ValidationResult:
@@ -456,12 +656,25 @@ class PrefixValidator:
         Args:
             expression: The prefix expression to validate (space-separated)
             
+        Returns:
+            ValidationResult with validation details
+        """
+        return self.validate_tokens(ExpressionTokenizer.tokenize_prefix(expression))
+    
+    def validate_tokens(self, tokens: List[str]) -> ValidationResult:
+        """
+        Validate an already tokenized prefix expression.
+        
+        The token list is not modified; a reversed copy is processed.
+        
+        Args:
+            tokens: Tokens produced by ExpressionTokenizer.tokenize_prefix
+            
         Returns:
             ValidationResult with validation details
         """
         self.pda.reset()
-        tokens = ExpressionTokenizer.tokenize_prefix(expression)
-        execution_trace = []
+        execution_trace = [None] * len(tokens)
         
         if not tokens:
             return ValidationResult(
@@ -469,7 +682,7 @@ class PrefixValidator:
                 notation=NotationType.PREFIX,
                 message="Empty expression",
                 execution_trace=["No tokens to process"],
-                final_state="q_error"
+                final_state=_Q_ERROR
             )
         
         # Process right to left
@@ -479,42 +692,51 @@ class PrefixValidator:
         for i, token in enumerate(tokens):
             token_type = ExpressionTokenizer.classify_token(token)
             
-            if token_type == "INVALID":
+            if token_type is _INVALID:
+                del execution_trace[i:]
                 return ValidationResult(
                     is_valid=False,
                     notation=NotationType.PREFIX,
                     message=f"Invalid token: {token}",
                     execution_trace=execution_trace,
-                    final_state="q_error"
+                    final_state=_Q_ERROR
                 )
             
-            if token_type == "LPAREN" or token_type == "RPAREN":
+            if token_type is _LPAREN or token_type is _RPAREN:
+                del execution_trace[i:]
                 return ValidationResult(
                     is_valid=False,
                     notation=NotationType.PREFIX,
                     message="Parentheses not allowed in prefix notation",
                     execution_trace=execution_trace,
-                    final_state="q_error"
+                    final_state=_Q_ERROR
                 )
             
-            if token_type == "OPERAND":
+            if token_type is _OPERAND:
                 operand_count += 1
                 self.pda.stack.push("X")
-                trace_entry = f"Token: '{token}' (OPERAND) [R→L] | Operands: {operand_count} | Stack: {self.pda.stack.get_contents()}"
+                trace_entry = ''.join((
+                    "Token: '", token, "' (OPERAND) [R→L] | Operands: ", str(operand_count),
+                    " | Stack: ", str(self.pda.stack.get_contents())
+                ))
             else:  # OPERATOR
                 if operand_count < 2:
+                    del execution_trace[i:]
                     return ValidationResult(
                         is_valid=False,
                         notation=NotationType.PREFIX,
                         message=f"Not enough operands for operator '{token}'",
                         execution_trace=execution_trace,
-                        final_state="q_error"
+                        final_state=_Q_ERROR
                     )
                 operand_count -= 1  # Two operands become one result
                 self.pda.stack.pop()
-                trace_entry = f"Token: '{token}' (OPERATOR) [R→L] | Operands: {operand_count} | Stack: {self.pda.stack.get_contents()}"
+                trace_entry = ''.join((
+                    "Token: '", token, "' (OPERATOR) [R→L] | Operands: ", str(operand_count),
+                    " | Stack: ", str(self.pda.stack.get_contents())
+                ))
             
-            execution_trace.append(trace_entry)
+            execution_trace[i] = trace_entry
         
         # Check final condition: exactly one operand remaining
         if operand_count == 1:
@@ -531,7 +753,7 @@ class PrefixValidator:
                 notation=NotationType.PREFIX,
                 message=f"Too many operands ({operand_count}) - missing operators",
                 execution_trace=execution_trace,
-                final_state="q_error"
+                final_state=_Q_ERROR
             )
         else:
             return ValidationResult(
@@ -539,9 +761,14 @@ class PrefixValidator:
                 notation=NotationType.PREFIX,
                 message="No result - expression is incomplete",
                 execution_trace=execution_trace,
-                final_state="q_error"
+                final_state=_Q_ERROR
             )
     
+    def validate_fast(self, expression: str) -> bool:
+        """Check whether a prefix expression is valid, without building a trace."""
+        return _count_operands(_encode_tokens(
+            ExpressionTokenizer.tokenize_prefix(expression)[::-1])) == 1
+    
     def get_pda(self) -> PushdownAutomata:
         """Return the underlying PDA for diagram generation."""
         return self.pda
@@ -584,14 +811,30 @@ class ExpressionValidator:
                 notation=notation,
                 message="Unknown notation type",
                 execution_trace=[],
-                final_state="q_error"
+                final_state=_Q_ERROR
             )
     
+    def validate_fast(self, expression: str, notation: NotationType) -> bool:
+        """
+        Check whether an expression is valid in the specified notation.
+        
+        Gives the same verdict as validate() but skips the execution trace
+        and messages, for callers that only need a yes/no answer.
+        """
+        if notation == NotationType.INFIX:
+            return self.infix_validator.validate_fast(expression)
+        elif notation == NotationType.POSTFIX:
+            return self.postfix_validator.validate_fast(expression)
+        elif notation == NotationType.PREFIX:
+            return self.prefix_validator.validate_fast(expression)
+        return False
+    
     def validate_all(self, expression: str) -> Dict[NotationType, ValidationResult]:
         """
         Validate expression against all notation types.
         
-        Useful for testing or when notation is unknown.
+        Useful for testing or when notation is unknown. The expression is
+        tokenized once per tokenizer; postfix and prefix share their tokens.
         
         Args:
             expression: The expression to validate
@@ -599,10 +842,12 @@ class ExpressionValidator:
         Returns:
             Dictionary mapping notation type to validation result
         """
+        infix_tokens = ExpressionTokenizer.tokenize_infix(expression)
+        pnp_tokens = ExpressionTokenizer.tokenize_postfix(expression)
         return {
-            NotationType.INFIX: self.validate(expression, NotationType.INFIX),
-            NotationType.POSTFIX: self.validate(expression, NotationType.POSTFIX),
-            NotationType.PREFIX: self.validate(expression, NotationType.PREFIX)
+            NotationType.INFIX: self.infix_validator.validate_tokens(infix_tokens),
+            NotationType.POSTFIX: self.postfix_validator.validate_tokens(pnp_tokens),
+            NotationType.PREFIX: self.prefix_validator.validate_tokens(pnp_tokens)
         }
     
     def get_pda(self, notation: NotationType) -> PushdownAutomata:
@@ -5,9 +5,12 @@ Reusable UI components built with Pygame for the expression
 validator and converter application.
 """
 
+import bisect
+import functools
+import math
 import pygame
+from array import array
 from typing import List, Tuple, Optional, Callable, Dict, Any
-from dataclasses import dataclass
 from enum import Enum
 
 
@@ -46,56 +49,151 @@ class Colors:
     BORDER_ERROR = (255, 82, 82)
 
 
+@functools.lru_cache(maxsize=32)
+def _load_font(sysfont_name: str, size: int, bold: bool) -> pygame.font.Font:
+    """Open a system font once; later lookups share the same handle."""
+    return pygame.font.SysFont(sysfont_name, size, bold=bold)
+
+
 class FontManager:
     """Manages fonts for the application."""
     
-    _fonts: Dict[str, pygame.font.Font] = {}
+    # Font specs by style: (system font name, size, bold). Fonts are only
+    # opened the first time a style is used.
+    _fonts: Dict[str, Tuple[str, int, bool]] = {
+        'title': ('Segoe UI', 32, True),
+        'heading': ('Segoe UI', 24, True),
+        'body': ('Segoe UI', 18, False),
+        'small': ('Segoe UI', 14, False),
+        'mono': ('Consolas', 16, False),
+        'mono_small': ('Consolas', 14, False),
+        'button': ('Segoe UI', 16, True),
+    }
+    _body = _fonts['body']
     _initialized = False
     
     @classmethod
     def init(cls):
-        """Initialize fonts."""
+        """Initialize the font module."""
         if cls._initialized:
             return
         
         pygame.font.init()
         
-        # Try to load modern fonts, fallback to system fonts
-        font_names = ['Consolas', 'Monaco', 'Menlo', 'DejaVu Sans Mono', 'monospace']
-        
-        cls._fonts['title'] = pygame.font.SysFont('Segoe UI', 32, bold=True)
-        cls._fonts['heading'] = pygame.font.SysFont('Segoe UI', 24, bold=True)
-        cls._fonts['body'] = pygame.font.SysFont('Segoe UI', 18)
-        cls._fonts['small'] = pygame.font.SysFont('Segoe UI', 14)
-        cls._fonts['mono'] = pygame.font.SysFont('Consolas', 16)
-        cls._fonts['mono_small'] = pygame.font.SysFont('Consolas', 14)
-        cls._fonts['button'] = pygame.font.SysFont('Segoe UI', 16, bold=True)
-        
+        # From now on skip the initialization check on every lookup
+        cls.get = cls._get
         cls._initialized = True
     
     @classmethod
     def get(cls, name: str) -> pygame.font.Font:
-        """Get a font by name."""
-        if not cls._initialized:
-            cls.init()
-        return cls._fonts.get(name, cls._fonts['body'])
+        """Get a font by name, falling back to the body font."""
+        cls.init()
+        return cls._get(name)
+    
+    @classmethod
+    def _get(cls, name: str) -> pygame.font.Font:
+        return _load_font(*cls._fonts.get(name, cls._body))
+
+
+def _display_format(surface: pygame.Surface) -> pygame.Surface:
+    """
+    Convert surface to the display's pixel format so blits skip conversion.
+    
+    Without a display mode (headless use) the surface is returned unchanged.
+    """
+    try:
+        if surface.get_flags() & pygame.SRCALPHA:
+            return surface.convert_alpha()
+        return surface.convert()
+    except pygame.error:
+        return surface
+
+
+@functools.lru_cache(maxsize=4096)
+def render_text(font_name: str, text: str,
+                color: Tuple[int, int, int]) -> pygame.Surface:
+    """
+    Render text with a named font, reusing the surface for repeated calls.
+    
+    The cache is keyed on (font_name, text, color), so changing a component's
+    text or color simply produces a new key. Returned surfaces are shared and
+    must not be drawn on.
+    """
+    return _display_format(FontManager.get(font_name).render(text, True, color))
+
+
+@functools.lru_cache(maxsize=256)
+def _rounded_box(width: int, height: int, radius: int,
+                 fill: Tuple[int, int, int],
+                 border: Optional[Tuple[int, int, int]] = None,
+                 border_width: int = 0) -> pygame.Surface:
+    """
+    Render a filled rounded rectangle with an optional border, cached.
+    
+    Components only use a handful of (size, color, state) combinations, so the
+    corner rasterization happens once per combination instead of every frame.
+    """
+    box = pygame.Surface((width, height), pygame.SRCALPHA)
+    rect = box.get_rect()
+    pygame.draw.rect(box, fill, rect, border_radius=radius)
+    if border is not None:
+        pygame.draw.rect(box, border, rect, width=border_width, border_radius=radius)
+    return _display_format(box)
+
+
+def _blit_clipped(surface: pygame.Surface, source: pygame.Surface,
+                  pos: Tuple[int, int], clip: pygame.Rect) -> None:
+    """
+    Blit source at pos, cropped to clip.
+    
+    Crops through the blit's source area instead of set_clip, so the
+    surface's own clip (the damaged region being redrawn) is left alone.
+    """
+    x, y = pos
+    shown = clip.clip(source.get_rect(topleft=pos))
+    if shown.width and shown.height:
+        surface.blit(source, shown.topleft, shown.move(-x, -y))
+
+
+@functools.lru_cache(maxsize=8192)
+def _measure(font_name: str, text: str) -> Tuple[int, int]:
+    """Return the rendered (width, height) of text, cached per font."""
+    return FontManager.get(font_name).size(text)
 
 
-@dataclass
 class Rect:
-    """Rectangle helper class."""
-    x: int
-    y: int
-    width: int
-    height: int
+    """
+    Rectangle helper class.
     
-    def to_pygame(self) -> pygame.Rect:
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+    Keeps a persistent pygame.Rect companion so drawing code does not need to
+    allocate one per frame. Call _sync() after mutating the fields.
+    """
+    
+    __slots__ = ('x', 'y', 'width', 'height', '_pg')
+    
+    def __init__(self, x: int, y: int, width: int, height: int):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self._pg = pygame.Rect(x, y, width, height)
     
-    def contains(self, point: Tuple[int, int]) -> bool:
-        px, py = point
-        return (self.x <= px <= self.x + self.width and 
-                self.y <= py <= self.y + self.height)
+    def __repr__(self) -> str:
+        return f"Rect(x={self.x}, y={self.y}, width={self.width}, height={self.height})"
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Rect):
+            return (self.x, self.y, self.width, self.height) == \
+                   (other.x, other.y, other.width, other.height)
+        return NotImplemented
+    
+    def _sync(self) -> None:
+        """Copy the current fields into the pygame.Rect companion."""
+        self._pg.update(self.x, self.y, self.width, self.height)
+    
+    def to_pygame(self) -> pygame.Rect:
+        """Return the shared pygame.Rect companion (do not mutate it)."""
+        return self._pg
 
 
 class Component:
@@ -103,8 +201,36 @@ class Component:
     
     def __init__(self, x: int, y: int, width: int, height: int):
         self.rect = Rect(x, y, width, height)
+        self._pg_rect = self.rect._pg
+        # Owning panel and our slot in its child arrays, set by add_child
+        self._parent: Optional['Panel'] = None
+        self._child_index = -1
+        # Set by every state change that affects drawing
+        self._dirty = True
         self.visible = True
         self.enabled = True
+        # Maps pygame event types to bound handlers; subclasses register
+        # only the event types they care about
+        self._event_handlers: Dict[int, Callable[[pygame.event.Event], bool]] = {}
+    
+    @property
+    def visible(self) -> bool:
+        return self._visible
+    
+    @visible.setter
+    def visible(self, visible: bool) -> None:
+        self._visible = visible
+        self._dirty = True
+        if self._parent is not None:
+            self._parent._child_visible[self._child_index] = bool(visible)
+    
+    def is_dirty(self) -> bool:
+        """Check if the component changed since it was last marked clean."""
+        return self._dirty
+    
+    def mark_clean(self) -> None:
+        """Mark the component as drawn."""
+        self._dirty = False
     
     def draw(self, surface: pygame.Surface) -> None:
         """Draw the component. Override in subclasses."""
@@ -112,7 +238,14 @@ class Component:
     
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle pygame event. Returns True if event was consumed."""
-        return False
+        if not self.visible or not self.enabled:
+            return False
+        handler = self._event_handlers.get(event.type)
+        return handler(event) if handler else False
+    
+    def handles(self, event_type: int) -> bool:
+        """Check whether events of this type can ever be consumed or tracked."""
+        return event_type in self._event_handlers
     
     def update(self, dt: float) -> None:
         """Update component state. dt is delta time in seconds."""
@@ -129,40 +262,69 @@ class Label(Component):
         super().__init__(x, y, 0, 0)
         self.text = text
         self.font_name = font_name
-        self.color = color
+        self._color = color
         self.max_width = max_width
         self._update_size()
     
+    @property
+    def color(self) -> Tuple[int, int, int]:
+        return self._color
+    
+    @color.setter
+    def color(self, color: Tuple[int, int, int]) -> None:
+        self._color = color
+        self._render()
+    
     def _update_size(self):
-        font = FontManager.get(self.font_name)
-        self.rect.width, self.rect.height = font.size(self.text)
+        self.rect.width, self.rect.height = _measure(self.font_name, self.text)
+        self.rect._sync()
+        self._display_text = self._truncate()
+        self._render()
+    
+    def _render(self) -> None:
+        """Render the display text once; draw only blits the result."""
+        self._surface = render_text(self.font_name, self._display_text, self._color)
+        self._dirty = True
+    
+    def _truncate(self) -> str:
+        """Return the text to display, truncated with an ellipsis if too wide."""
+        if not (self.max_width and self.rect.width > self.max_width):
+            return self.text
+        # Binary search for the longest prefix that fits with the ellipsis;
+        # prefix widths grow with length, so the fitting prefixes are contiguous
+        lo, hi = 0, len(self.text)
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if _measure(self.font_name, self.text[:mid] + "...")[0] <= self.max_width:
+                lo = mid
+            else:
+                hi = mid - 1
+        return self.text[:lo] + "..."
     
     def set_text(self, text: str):
         self.text = text
         self._update_size()
+        self._dirty = True
     
     def draw(self, surface: pygame.Surface) -> None:
         if not self.visible:
             return
         
-        font = FontManager.get(self.font_name)
-        
-        if self.max_width and self.rect.width > self.max_width:
-            # Truncate with ellipsis
-            text = self.text
-            while font.size(text + "...")[0] > self.max_width and len(text) > 0:
-                text = text[:-1]
-            text += "..." if text != self.text else ""
-            rendered = font.render(text, True, self.color)
-        else:
-            rendered = font.render(self.text, True, self.color)
-        
-        surface.blit(rendered, (self.rect.x, self.rect.y))
+        surface.blit(self._surface, self._pg_rect)
 
 
 class Button(Component):
     """Clickable button component."""
     
+    # Base (background, text) colors per style
+    STYLES = {
+        'primary': (Colors.ACCENT_PRIMARY, Colors.TEXT_DARK),
+        'secondary': (Colors.BG_LIGHT, Colors.TEXT_PRIMARY),
+        'danger': (Colors.ACCENT_ERROR, Colors.TEXT_PRIMARY),
+        'success': (Colors.ACCENT_SUCCESS, Colors.TEXT_DARK),
+    }
+    DEFAULT_STYLE = (Colors.BG_MEDIUM, Colors.TEXT_PRIMARY)
+    
     def __init__(self, x: int, y: int, width: int, height: int,
                  text: str, on_click: Optional[Callable] = None,
                  style: str = 'primary'):
@@ -172,75 +334,95 @@ class Button(Component):
         self.style = style
         self.hovered = False
         self.pressed = False
+        self._event_handlers = {
+            pygame.MOUSEMOTION: self._on_motion,
+            pygame.MOUSEBUTTONDOWN: self._on_mousedown,
+            pygame.MOUSEBUTTONUP: self._on_mouseup,
+        }
+    
+    @property
+    def style(self) -> str:
+        return self._style
+    
+    @style.setter
+    def style(self, style: str) -> None:
+        """Set the style and precompute the colors for every button state."""
+        self._style = style
+        bg, text = self.STYLES.get(style, self.DEFAULT_STYLE)
+        normal = (bg, text)
+        hover = (tuple(min(255, c + 20) for c in bg), text)
+        pressed = (tuple(max(0, c - 30) for c in bg), text)
+        disabled = (tuple(c // 2 for c in bg), Colors.TEXT_MUTED)
+        # Keyed on (enabled, pressed, hovered); disabled wins over pressed,
+        # which wins over hovered
+        self._colors = {
+            (enabled, is_pressed, hovered): (
+                disabled if not enabled else
+                pressed if is_pressed else
+                hover if hovered else normal)
+            for enabled in (False, True)
+            for is_pressed in (False, True)
+            for hovered in (False, True)
+        }
+        # Composed background + text per (text, enabled, pressed, hovered)
+        self._faces: Dict[Tuple[str, bool, bool, bool], pygame.Surface] = {}
+        self._dirty = True
     
     def _get_colors(self) -> Tuple[Tuple[int, int, int], ...]:
         """Get background and text colors based on style and state."""
-        if self.style == 'primary':
-            bg = Colors.ACCENT_PRIMARY
-            text = Colors.TEXT_DARK
-        elif self.style == 'secondary':
-            bg = Colors.BG_LIGHT
-            text = Colors.TEXT_PRIMARY
-        elif self.style == 'danger':
-            bg = Colors.ACCENT_ERROR
-            text = Colors.TEXT_PRIMARY
-        elif self.style == 'success':
-            bg = Colors.ACCENT_SUCCESS
-            text = Colors.TEXT_DARK
-        else:
-            bg = Colors.BG_MEDIUM
-            text = Colors.TEXT_PRIMARY
+        return self._colors[(bool(self.enabled), bool(self.pressed), bool(self.hovered))]
+    
+    def face(self) -> pygame.Surface:
+        """Return the button as it currently looks, composed once per state."""
+        key = (self.text, bool(self.enabled), bool(self.pressed), bool(self.hovered))
+        face = self._faces.get(key)
+        if face is None:
+            face = self._faces[key] = self._render_face()
+        return face
+    
+    def _render_face(self) -> pygame.Surface:
+        """Compose the rounded background and centered text for the current state."""
+        bg_color, text_color = self._get_colors()
+        width, height = self.rect.width, self.rect.height
+        face = pygame.Surface((width, height), pygame.SRCALPHA)
         
-        if not self.enabled:
-            bg = tuple(c // 2 for c in bg)
-            text = Colors.TEXT_MUTED
-        elif self.pressed:
-            bg = tuple(max(0, c - 30) for c in bg)
-        elif self.hovered:
-            bg = tuple(min(255, c + 20) for c in bg)
+        # Rounded background, with a border on hover
+        border = Colors.BORDER_FOCUS if self.hovered and self.enabled else None
+        face.blit(_rounded_box(width, height, 8, bg_color, border, 2), (0, 0))
         
-        return bg, text
+        # Text centered
+        text_surface = render_text('button', self.text, text_color)
+        face.blit(text_surface, text_surface.get_rect(center=(width // 2, height // 2)))
+        return _display_format(face)
     
     def draw(self, surface: pygame.Surface) -> None:
         if not self.visible:
             return
-        
-        bg_color, text_color = self._get_colors()
-        
-        # Draw rounded rectangle background
-        pygame.draw.rect(surface, bg_color, self.rect.to_pygame(), border_radius=8)
-        
-        # Draw border on hover
-        if self.hovered and self.enabled:
-            pygame.draw.rect(surface, Colors.BORDER_FOCUS, self.rect.to_pygame(), 
-                           width=2, border_radius=8)
-        
-        # Draw text centered
-        font = FontManager.get('button')
-        text_surface = font.render(self.text, True, text_color)
-        text_rect = text_surface.get_rect(center=self.rect.to_pygame().center)
-        surface.blit(text_surface, text_rect)
+        surface.blit(self.face(), self._pg_rect)
     
-    def handle_event(self, event: pygame.event.Event) -> bool:
-        if not self.visible or not self.enabled:
-            return False
-        
-        if event.type == pygame.MOUSEMOTION:
-            self.hovered = self.rect.contains(event.pos)
-        
-        elif event.type == pygame.MOUSEBUTTONDOWN:
-            if event.button == 1 and self.rect.contains(event.pos):
-                self.pressed = True
+    def _on_motion(self, event: pygame.event.Event) -> bool:
+        hovered = self._pg_rect.collidepoint(event.pos)
+        if hovered != self.hovered:
+            self.hovered = hovered
+            self._dirty = True
+        return False
+    
+    def _on_mousedown(self, event: pygame.event.Event) -> bool:
+        if event.button == 1 and self._pg_rect.collidepoint(event.pos):
+            self.pressed = True
+            self._dirty = True
+            return True
+        return False
+    
+    def _on_mouseup(self, event: pygame.event.Event) -> bool:
+        if event.button == 1:
+            was_pressed = self.pressed
+            self.pressed = False
+            if was_pressed:
+                self._dirty = True
+            if was_pressed and self._pg_rect.collidepoint(event.pos) and self.on_click:
+                self.on_click()
                 return True
-        
-        elif event.type == pygame.MOUSEBUTTONUP:
-            if event.button == 1:
-                was_pressed = self.pressed
-                self.pressed = False
-                if was_pressed and self.rect.contains(event.pos) and self.on_click:
-                    self.on_click()
-                    return True
-        
         return False
 
 
@@ -257,24 +439,63 @@ class InputField(Component):
         self.on_submit = on_submit
         self.focused = False
         self.cursor_pos = 0
-        self.cursor_visible = True
-        self.cursor_timer = 0
+        # Cursor blinks on a 500ms half-period counted from this tick;
+        # _drawn_cursor_visible is the phase last drawn
+        self._blink_epoch = pygame.time.get_ticks()
+        self._drawn_cursor_visible = True
+        self._measured_text: Optional[str] = None
+        self._prefix_widths = array('i')
+        self._event_handlers = {
+            pygame.MOUSEBUTTONDOWN: self._on_mousedown,
+            pygame.KEYDOWN: self._on_keydown,
+        }
+        # Editing keys; any other key is treated as text input
+        self._key_handlers: Dict[int, Callable[[], None]] = {
+            pygame.K_BACKSPACE: self._key_backspace,
+            pygame.K_DELETE: self._key_delete,
+            pygame.K_LEFT: self._key_left,
+            pygame.K_RIGHT: self._key_right,
+            pygame.K_HOME: self._key_home,
+            pygame.K_END: self._key_end,
+            pygame.K_RETURN: self._key_return,
+        }
+    
+    def _get_prefix_widths(self) -> array:
+        """
+        Return the pixel width of every prefix of the text.
+        
+        Entry i is the width of text[:i]. Rebuilt lazily when the text changes;
+        widths are non-decreasing, so the array can be bisected.
+        """
+        if self._measured_text is not self.text:
+            text = self.text
+            self._prefix_widths = array(
+                'i', (_measure('mono', text[:i])[0] for i in range(len(text) + 1)))
+            self._measured_text = text
+        return self._prefix_widths
+    
+    @property
+    def cursor_visible(self) -> bool:
+        """Whether the blinking cursor is in its visible phase."""
+        return ((pygame.time.get_ticks() - self._blink_epoch) // 500) & 1 == 0
+    
+    def is_dirty(self) -> bool:
+        """Check for changes, including a cursor blink while focused."""
+        return self._dirty or (self.focused and
+                               self.cursor_visible != self._drawn_cursor_visible)
     
     def draw(self, surface: pygame.Surface) -> None:
         if not self.visible:
             return
         
-        # Background
+        # Background and border
         bg_color = Colors.BG_LIGHT if self.focused else Colors.BG_MEDIUM
-        pygame.draw.rect(surface, bg_color, self.rect.to_pygame(), border_radius=6)
-        
-        # Border
         border_color = Colors.BORDER_FOCUS if self.focused else Colors.BORDER_DEFAULT
-        pygame.draw.rect(surface, border_color, self.rect.to_pygame(), 
-                        width=2, border_radius=6)
+        surface.blit(_rounded_box(self.rect.width, self.rect.height, 6,
+                                  bg_color, border_color, 2),
+                     self._pg_rect)
         
         # Text or placeholder
-        font = FontManager.get('mono')
         if self.text:
             text_color = Colors.TEXT_PRIMARY
             display_text = self.text
@@ -282,90 +503,89 @@ class InputField(Component):
             text_color = Colors.TEXT_MUTED
             display_text = self.placeholder
         
-        text_surface = font.render(display_text, True, text_color)
+        text_surface = render_text('mono', display_text, text_color)
         text_rect = text_surface.get_rect(midleft=(self.rect.x + 12, 
                                                     self.rect.y + self.rect.height // 2))
         
         # Clip text to input area
         clip_rect = pygame.Rect(self.rect.x + 8, self.rect.y, 
                                self.rect.width - 16, self.rect.height)
-        surface.set_clip(clip_rect)
-        surface.blit(text_surface, text_rect)
-        surface.set_clip(None)
+        _blit_clipped(surface, text_surface, text_rect.topleft, clip_rect)
         
         # Cursor
-        if self.focused and self.cursor_visible:
-            cursor_x = self.rect.x + 12 + font.size(self.text[:self.cursor_pos])[0]
+        cursor_visible = self._drawn_cursor_visible = self.cursor_visible
+        if self.focused and cursor_visible:
+            cursor_x = self.rect.x + 12 + self._get_prefix_widths()[self.cursor_pos]
             cursor_y1 = self.rect.y + 8
             cursor_y2 = self.rect.y + self.rect.height - 8
             pygame.draw.line(surface, Colors.ACCENT_PRIMARY, 
                            (cursor_x, cursor_y1), (cursor_x, cursor_y2), 2)
     
-    def handle_event(self, event: pygame.event.Event) -> bool:
-        if not self.visible or not self.enabled:
+    def _on_mousedown(self, event: pygame.event.Event) -> bool:
+        if event.button != 1:
             return False
-        
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            if event.button == 1:
-                was_focused = self.focused
-                self.focused = self.rect.contains(event.pos)
-                if self.focused:
-                    # Set cursor position based on click
-                    font = FontManager.get('mono')
-                    click_x = event.pos[0] - self.rect.x - 12
-                    self.cursor_pos = len(self.text)
-                    for i in range(len(self.text) + 1):
-                        if font.size(self.text[:i])[0] >= click_x:
-                            self.cursor_pos = i
-                            break
-                return self.focused or was_focused
-        
+        was_focused = self.focused
+        self.focused = self._pg_rect.collidepoint(event.pos)
+        if self.focused != was_focused:
+            self._dirty = True
+            self._blink_epoch = pygame.time.get_ticks()
+        if self.focused:
+            # Set cursor position based on click: first prefix at
+            # least as wide as the click offset
+            click_x = event.pos[0] - self.rect.x - 12
+            self.cursor_pos = min(len(self.text), bisect.bisect_left(
+                self._get_prefix_widths(), click_x))
+            self._dirty = True
+        return self.focused or was_focused
+    
+    def _on_keydown(self, event: pygame.event.Event) -> bool:
         if not self.focused:
             return False
-        
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_BACKSPACE:
-                if self.cursor_pos > 0:
-                    self.text = self.text[:self.cursor_pos-1] + self.text[self.cursor_pos:]
-                    self.cursor_pos -= 1
-                    if self.on_change:
-                        self.on_change(self.text)
-            elif event.key == pygame.K_DELETE:
-                if self.cursor_pos < len(self.text):
-                    self.text = self.text[:self.cursor_pos] + self.text[self.cursor_pos+1:]
-                    if self.on_change:
-                        self.on_change(self.text)
-            elif event.key == pygame.K_LEFT:
-                self.cursor_pos = max(0, self.cursor_pos - 1)
-            elif event.key == pygame.K_RIGHT:
-                self.cursor_pos = min(len(self.text), self.cursor_pos + 1)
-            elif event.key == pygame.K_HOME:
-                self.cursor_pos = 0
-            elif event.key == pygame.K_END:
-                self.cursor_pos = len(self.text)
-            elif event.key == pygame.K_RETURN:
-                if self.on_submit:
-                    self.on_submit(self.text)
-            elif event.unicode and event.unicode.isprintable():
-                self.text = self.text[:self.cursor_pos] + event.unicode + self.text[self.cursor_pos:]
-                self.cursor_pos += 1
-                if self.on_change:
-                    self.on_change(self.text)
-            
-            return True
-        
-        return False
+        self._dirty = True
+        handler = self._key_handlers.get(event.key)
+        if handler:
+            handler()
+        elif event.unicode and event.unicode.isprintable():
+            self.text = self.text[:self.cursor_pos] + event.unicode + self.text[self.cursor_pos:]
+            self.cursor_pos += 1
+            if self.on_change:
+                self.on_change(self.text)
+        return True
     
-    def update(self, dt: float) -> None:
-        self.cursor_timer += dt
-        if self.cursor_timer >= 0.5:
-            self.cursor_timer = 0
-            self.cursor_visible = not self.cursor_visible
+    def _key_backspace(self) -> None:
+        if self.cursor_pos > 0:
+            self.text = self.text[:self.cursor_pos-1] + self.text[self.cursor_pos:]
+            self.cursor_pos -= 1
+            if self.on_change:
+                self.on_change(self.text)
+    
+    def _key_delete(self) -> None:
+        if self.cursor_pos < len(self.text):
+            self.text = self.text[:self.cursor_pos] + self.text[self.cursor_pos+1:]
+            if self.on_change:
+                self.on_change(self.text)
+    
+    def _key_left(self) -> None:
+        self.cursor_pos = max(0, self.cursor_pos - 1)
+    
+    def _key_right(self) -> None:
+        self.cursor_pos = min(len(self.text), self.cursor_pos + 1)
+    
+    def _key_home(self) -> None:
+        self.cursor_pos = 0
+    
+    def _key_end(self) -> None:
+        self.cursor_pos = len(self.text)
+    
+    def _key_return(self) -> None:
+        if self.on_submit:
+            self.on_submit(self.text)
     
     def set_text(self, text: str):
         """Set the input text programmatically."""
         self.text = text
         self.cursor_pos = len(text)
+        self._dirty = True
         if self.on_change:
             self.on_change(text)
     
@@ -373,6 +593,7 @@ class InputField(Component):
         """Clear the input field."""
         self.text = ""
         self.cursor_pos = 0
+        self._dirty = True
 
 
 class Dropdown(Component):
@@ -380,13 +601,64 @@ class Dropdown(Component):
     
     def __init__(self, x: int, y: int, width: int, height: int,
                  options: List[str], selected_index: int = 0,
-                 on_change: Optional[Callable] = None):
+                 on_change: Optional[Callable] = None,
+                 max_list_height: Optional[int] = None):
         super().__init__(x, y, width, height)
-        self.options = options
         self.selected_index = selected_index
         self.on_change = on_change
         self.expanded = False
         self.hovered_index = -1
+        # When the options don't fit in max_list_height the list scrolls;
+        # scroll_offset is the index of the first option shown
+        self.scroll_offset = 0
+        self._max_list_height = max_list_height
+        self.options = options
+        self._event_handlers = {
+            pygame.MOUSEMOTION: self._on_motion,
+            pygame.MOUSEBUTTONDOWN: self._on_mousedown,
+            pygame.MOUSEWHEEL: self._on_wheel,
+        }
+        # Row highlights for the hovered and selected options
+        self._hover_bg = _rounded_box(width - 8, 32, 4, Colors.ACCENT_PRIMARY)
+        self._selected_bg = _rounded_box(width - 8, 32, 4, Colors.BG_LIGHT)
+        # Arrow icons are static, so render them once (11x7, tip up/down)
+        self._arrow_up = pygame.Surface((11, 7), pygame.SRCALPHA)
+        pygame.draw.polygon(self._arrow_up, Colors.TEXT_SECONDARY, [(0, 6), (10, 6), (5, 0)])
+        self._arrow_down = pygame.Surface((11, 7), pygame.SRCALPHA)
+        pygame.draw.polygon(self._arrow_down, Colors.TEXT_SECONDARY, [(0, 0), (10, 0), (5, 6)])
+        self._arrow_up = _display_format(self._arrow_up)
+        self._arrow_down = _display_format(self._arrow_down)
+    
+    @property
+    def options(self) -> Tuple[str, ...]:
+        return self._options
+    
+    @options.setter
+    def options(self, options: List[str]) -> None:
+        self._options = tuple(options)
+        self._relayout()
+    
+    @property
+    def max_list_height(self) -> Optional[int]:
+        return self._max_list_height
+    
+    @max_list_height.setter
+    def max_list_height(self, max_list_height: Optional[int]) -> None:
+        self._max_list_height = max_list_height
+        self._relayout()
+    
+    def _relayout(self) -> None:
+        """Precompute the list box and the rect of every visible option row."""
+        visible_count = self._visible_count()
+        list_y = self.rect.y + self.rect.height + 4
+        self._list_rect = pygame.Rect(self.rect.x, list_y,
+                                      self.rect.width, visible_count * 36 + 8)
+        self._row_rects = [pygame.Rect(self.rect.x + 4, list_y + 4 + row * 36,
+                                       self.rect.width - 8, 32)
+                           for row in range(visible_count)]
+        self.scroll_offset = max(0, min(self.scroll_offset,
+                                        len(self._options) - visible_count))
+        self._dirty = True
     
     def draw(self, surface: pygame.Surface) -> None:
         if not self.visible:
@@ -394,15 +666,14 @@ class Dropdown(Component):
         
         # Draw main button
         bg_color = Colors.BG_LIGHT if self.expanded else Colors.BG_MEDIUM
-        pygame.draw.rect(surface, bg_color, self.rect.to_pygame(), border_radius=6)
         border_color = Colors.BORDER_FOCUS if self.expanded else Colors.BORDER_DEFAULT
-        pygame.draw.rect(surface, border_color, self.rect.to_pygame(), 
-                        width=2, border_radius=6)
+        surface.blit(_rounded_box(self.rect.width, self.rect.height, 6,
+                                  bg_color, border_color, 2),
+                     self._pg_rect)
         
         # Draw selected text
-        font = FontManager.get('body')
         text = self.options[self.selected_index] if self.options else ""
-        text_surface = font.render(text, True, Colors.TEXT_PRIMARY)
+        text_surface = render_text('body', text, Colors.TEXT_PRIMARY)
         text_rect = text_surface.get_rect(midleft=(self.rect.x + 12, 
                                                     self.rect.y + self.rect.height // 2))
         surface.blit(text_surface, text_rect)
@@ -410,77 +681,114 @@ class Dropdown(Component):
         # Draw dropdown arrow
         arrow_x = self.rect.x + self.rect.width - 20
         arrow_y = self.rect.y + self.rect.height // 2
-        if self.expanded:
-            points = [(arrow_x - 5, arrow_y + 3), (arrow_x + 5, arrow_y + 3), (arrow_x, arrow_y - 3)]
-        else:
-            points = [(arrow_x - 5, arrow_y - 3), (arrow_x + 5, arrow_y - 3), (arrow_x, arrow_y + 3)]
-        pygame.draw.polygon(surface, Colors.TEXT_SECONDARY, points)
+        arrow = self._arrow_up if self.expanded else self._arrow_down
+        surface.blit(arrow, (arrow_x - 5, arrow_y - 3))
         
         # Draw dropdown list if expanded
         if self.expanded:
-            list_y = self.rect.y + self.rect.height + 4
-            list_height = len(self.options) * 36 + 8
-            list_rect = pygame.Rect(self.rect.x, list_y, self.rect.width, list_height)
+            first = self.scroll_offset
+            list_rect = self._list_rect
             
             # Background
             pygame.draw.rect(surface, Colors.BG_PANEL, list_rect, border_radius=6)
             pygame.draw.rect(surface, Colors.BORDER_DEFAULT, list_rect, width=2, border_radius=6)
             
-            # Options
-            for i, option in enumerate(self.options):
-                opt_y = list_y + 4 + i * 36
-                opt_rect = pygame.Rect(self.rect.x + 4, opt_y, self.rect.width - 8, 32)
+            # Options in view: pre-rendered highlights first, then texts,
+            # all in one batched blit
+            highlights = []
+            blits = []
+            for i, opt_rect in enumerate(self._row_rects, first):
+                option = self._options[i]
                 
                 # Highlight
                 if i == self.hovered_index:
-                    pygame.draw.rect(surface, Colors.ACCENT_PRIMARY, opt_rect, border_radius=4)
+                    highlights.append((self._hover_bg, opt_rect.topleft))
                     text_color = Colors.TEXT_DARK
                 elif i == self.selected_index:
-                    pygame.draw.rect(surface, Colors.BG_LIGHT, opt_rect, border_radius=4)
+                    highlights.append((self._selected_bg, opt_rect.topleft))
                     text_color = Colors.ACCENT_PRIMARY
                 else:
                     text_color = Colors.TEXT_PRIMARY
                 
-                text_surface = font.render(option, True, text_color)
+                text_surface = render_text('body', option, text_color)
                 text_rect = text_surface.get_rect(midleft=(opt_rect.x + 8, opt_rect.centery))
-                surface.blit(text_surface, text_rect)
+                blits.append((text_surface, text_rect))
+            highlights.extend(blits)
+            surface.blits(highlights, doreturn=False)
     
-    def handle_event(self, event: pygame.event.Event) -> bool:
-        if not self.visible or not self.enabled:
-            return False
+    def _visible_count(self) -> int:
+        """Return how many option rows fit in the list."""
+        count = len(self._options)
+        if self._max_list_height is not None:
+            count = min(count, max(1, (self._max_list_height - 8) // 36))
+        return count
+    
+    def _scroll_into_view(self, index: int) -> None:
+        """Adjust scroll_offset so the option at index is shown."""
+        visible_count = self._visible_count()
+        if index < self.scroll_offset:
+            self.scroll_offset = max(0, index)
+        elif index >= self.scroll_offset + visible_count:
+            self.scroll_offset = index - visible_count + 1
+    
+    def _option_at(self, pos: Tuple[int, int]) -> int:
+        """Return the index of the option row under pos, or -1.
         
-        if event.type == pygame.MOUSEMOTION:
+        Rows are 32px tall on a 36px pitch, so the hit test is plain
+        arithmetic rather than a scan over the options.
+        """
+        px, py = pos
+        x0 = self.rect.x + 4
+        if not x0 <= px < x0 + self.rect.width - 8:
+            return -1
+        dy = py - (self.rect.y + self.rect.height + 8)
+        if dy < 0:
+            return -1
+        i, offset = divmod(dy, 36)
+        if i >= self._visible_count() or offset >= 32:
+            return -1
+        return self.scroll_offset + i
+    
+    def _on_motion(self, event: pygame.event.Event) -> bool:
+        if not self.expanded:
+            return False
+        hovered_index = self._option_at(event.pos)
+        if hovered_index != self.hovered_index:
+            self.hovered_index = hovered_index
+            self._dirty = True
+        return hovered_index != -1
+    
+    def _on_mousedown(self, event: pygame.event.Event) -> bool:
+        if event.button != 1:
+            return False
+        if self._pg_rect.collidepoint(event.pos):
+            self.expanded = not self.expanded
             if self.expanded:
-                list_y = self.rect.y + self.rect.height + 4
-                for i in range(len(self.options)):
-                    opt_y = list_y + 4 + i * 36
-                    opt_rect = pygame.Rect(self.rect.x + 4, opt_y, self.rect.width - 8, 32)
-                    if opt_rect.collidepoint(event.pos):
-                        self.hovered_index = i
-                        return True
-                self.hovered_index = -1
-        
-        elif event.type == pygame.MOUSEBUTTONDOWN:
-            if event.button == 1:
-                if self.rect.contains(event.pos):
-                    self.expanded = not self.expanded
-                    return True
-                elif self.expanded:
-                    list_y = self.rect.y + self.rect.height + 4
-                    for i in range(len(self.options)):
-                        opt_y = list_y + 4 + i * 36
-                        opt_rect = pygame.Rect(self.rect.x + 4, opt_y, self.rect.width - 8, 32)
-                        if opt_rect.collidepoint(event.pos):
-                            self.selected_index = i
-                            self.expanded = False
-                            if self.on_change:
-                                self.on_change(i, self.options[i])
-                            return True
-                    self.expanded = False
-                    return True
-        
+                self._scroll_into_view(self.selected_index)
+            self._dirty = True
+            return True
+        if self.expanded:
+            self._dirty = True
+            self.expanded = False
+            i = self._option_at(event.pos)
+            if i != -1:
+                self.selected_index = i
+                if self.on_change:
+                    self.on_change(i, self.options[i])
+            return True
         return False
     
+    def _on_wheel(self, event: pygame.event.Event) -> bool:
+        if not self.expanded:
+            return False
+        scroll_offset = max(0, min(len(self.options) - self._visible_count(),
+                                   self.scroll_offset - event.y))
+        if scroll_offset != self.scroll_offset:
+            self.scroll_offset = scroll_offset
+            self.hovered_index = self._option_at(pygame.mouse.get_pos())
+            self._dirty = True
+        return True
+    
     def get_selected(self) -> str:
         """Get the currently selected option."""
         return self.options[self.selected_index] if self.options else ""
@@ -489,80 +797,106 @@ class Dropdown(Component):
 class ToggleButtonGroup(Component):
     """A group of toggle buttons where only one can be selected at a time."""
     
+    # (background, text, border) colors indexed by state:
+    # 0 = normal, 1 = hovered, 2 = selected
+    STATE_COLORS = (
+        (Colors.BG_MEDIUM, Colors.TEXT_PRIMARY, Colors.BORDER_DEFAULT),
+        (Colors.BG_LIGHT, Colors.ACCENT_PRIMARY, Colors.ACCENT_PRIMARY),
+        (Colors.ACCENT_PRIMARY, Colors.TEXT_DARK, Colors.ACCENT_PRIMARY),
+    )
+    
     def __init__(self, x: int, y: int, options: List[str], 
                  selected_index: int = 0,
                  on_change: Optional[Callable] = None,
                  button_width: int = 100, button_height: int = 40,
                  spacing: int = 8):
-        total_width = len(options) * button_width + (len(options) - 1) * spacing
-        super().__init__(x, y, total_width, button_height)
-        self.options = options
+        super().__init__(x, y, 0, button_height)
         self.selected_index = selected_index
         self.on_change = on_change
         self.button_width = button_width
         self.button_height = button_height
         self.spacing = spacing
         self.hovered_index = -1
+        self.options = options
+        self._event_handlers = {
+            pygame.MOUSEMOTION: self._on_motion,
+            pygame.MOUSEBUTTONDOWN: self._on_mousedown,
+        }
+    
+    @property
+    def options(self) -> Tuple[str, ...]:
+        return self._options
+    
+    @options.setter
+    def options(self, options: List[str]) -> None:
+        self._options = tuple(options)
+        self._relayout()
+    
+    def _relayout(self) -> None:
+        """Resize the group and precompute the rect of every button."""
+        count = len(self._options)
+        pitch = self.button_width + self.spacing
+        self.rect.width = count * self.button_width + (count - 1) * self.spacing
+        self.rect._sync()
+        self._option_rects = [pygame.Rect(self.rect.x + i * pitch, self.rect.y,
+                                          self.button_width, self.button_height)
+                              for i in range(count)]
+        self._dirty = True
     
     def _get_button_rect(self, index: int) -> pygame.Rect:
         """Get the rectangle for a button at given index."""
-        x = self.rect.x + index * (self.button_width + self.spacing)
-        return pygame.Rect(x, self.rect.y, self.button_width, self.button_height)
+        return self._option_rects[index]
+    
+    def _button_at(self, pos: Tuple[int, int]) -> int:
+        """Return the index of the button under pos, or -1 (including gaps)."""
+        px, py = pos
+        if not self.rect.y <= py < self.rect.y + self.button_height:
+            return -1
+        dx = px - self.rect.x
+        if dx < 0:
+            return -1
+        i, offset = divmod(dx, self.button_width + self.spacing)
+        if i >= len(self.options) or offset >= self.button_width:
+            return -1
+        return i
     
     def draw(self, surface: pygame.Surface) -> None:
         if not self.visible:
             return
         
-        font = FontManager.get('button')
-        
-        for i, option in enumerate(self.options):
-            btn_rect = self._get_button_rect(i)
-            
+        for i, (option, btn_rect) in enumerate(zip(self._options, self._option_rects)):
             # Determine colors based on state
-            if i == self.selected_index:
-                bg_color = Colors.ACCENT_PRIMARY
-                text_color = Colors.TEXT_DARK
-                border_color = Colors.ACCENT_PRIMARY
-            elif i == self.hovered_index:
-                bg_color = Colors.BG_LIGHT
-                text_color = Colors.ACCENT_PRIMARY
-                border_color = Colors.ACCENT_PRIMARY
-            else:
-                bg_color = Colors.BG_MEDIUM
-                text_color = Colors.TEXT_PRIMARY
-                border_color = Colors.BORDER_DEFAULT
+            state = 2 if i == self.selected_index else 1 if i == self.hovered_index else 0
+            bg_color, text_color, border_color = self.STATE_COLORS[state]
             
             # Draw button background
             pygame.draw.rect(surface, bg_color, btn_rect, border_radius=8)
             pygame.draw.rect(surface, border_color, btn_rect, width=2, border_radius=8)
             
             # Draw text centered
-            text_surface = font.render(option, True, text_color)
+            text_surface = render_text('button', option, text_color)
             text_rect = text_surface.get_rect(center=btn_rect.center)
             surface.blit(text_surface, text_rect)
     
-    def handle_event(self, event: pygame.event.Event) -> bool:
-        if not self.visible or not self.enabled:
+    def _on_motion(self, event: pygame.event.Event) -> bool:
+        hovered_index = self._button_at(event.pos)
+        if hovered_index != self.hovered_index:
+            self.hovered_index = hovered_index
+            self._dirty = True
+        return hovered_index != -1
+    
+    def _on_mousedown(self, event: pygame.event.Event) -> bool:
+        if event.button != 1:
             return False
-        
-        if event.type == pygame.MOUSEMOTION:
-            self.hovered_index = -1
-            for i in range(len(self.options)):
-                if self._get_button_rect(i).collidepoint(event.pos):
-                    self.hovered_index = i
-                    return True
-        
-        elif event.type == pygame.MOUSEBUTTONDOWN:
-            if event.button == 1:
-                for i in range(len(self.options)):
-                    if self._get_button_rect(i).collidepoint(event.pos):
-                        if i != self.selected_index:
-                            self.selected_index = i
-                            if self.on_change:
-                                self.on_change(i, self.options[i])
-                        return True
-        
-        return False
+        i = self._button_at(event.pos)
+        if i == -1:
+            return False
+        if i != self.selected_index:
+            self.selected_index = i
+            self._dirty = True
+            if self.on_change:
+                self.on_change(i, self.options[i])
+        return True
     
     def get_selected(self) -> str:
         """Get the currently selected option."""
@@ -572,6 +906,7 @@ class ToggleButtonGroup(Component):
         """Set the selected index."""
         if 0 <= index < len(self.options):
             self.selected_index = index
+            self._dirty = True
 
 
 class Panel(Component):
@@ -583,64 +918,177 @@ class Panel(Component):
         self.title = title
         self.padding = padding
         self.children: List[Component] = []
+        # Per-child visibility, rects and bound methods kept in parallel
+        # arrays so traversal doesn't chase attributes on every child
+        self._child_visible = array('b')
+        self._child_rects: List[pygame.Rect] = []
+        self._child_draw: List[Callable[[pygame.Surface], None]] = []
+        self._child_handle: List[Callable[[pygame.event.Event], bool]] = []
+        # Only children that override update() are ticked
+        self._child_update: List[Callable[[float], None]] = []
+        self._pointer_inside = False
     
     def add_child(self, child: Component) -> None:
         """Add a child component to the panel."""
+        child._parent = self
+        child._child_index = len(self.children)
         self.children.append(child)
+        self._child_visible.append(bool(child.visible))
+        self._child_rects.append(child._pg_rect)
+        self._child_draw.append(child.draw)
+        self._child_handle.append(child.handle_event)
+        if type(child).update is not Component.update:
+            self._child_update.append(child.update)
+        self._dirty = True
+    
+    def is_dirty(self) -> bool:
+        """Check if the panel or any of its children changed."""
+        return self._dirty or any(child.is_dirty() for child in self.children)
+    
+    def handles(self, event_type: int) -> bool:
+        """Check the panel itself and its children."""
+        return (event_type in self._event_handlers or
+                any(child.handles(event_type) for child in self.children))
+    
+    def mark_clean(self) -> None:
+        """Mark the panel and its children as drawn."""
+        self._dirty = False
+        for child in self.children:
+            child.mark_clean()
     
     def draw(self, surface: pygame.Surface) -> None:
         if not self.visible:
             return
         
+        self.draw_background(surface)
+        self.draw_content(surface)
+    
+    def draw_background(self, surface: pygame.Surface) -> None:
+        """Draw the static part of the panel: background, border and title."""
         # Background
-        pygame.draw.rect(surface, Colors.BG_PANEL, self.rect.to_pygame(), border_radius=12)
-        pygame.draw.rect(surface, Colors.BORDER_DEFAULT, self.rect.to_pygame(), 
-                        width=1, border_radius=12)
+        surface.blit(_rounded_box(self.rect.width, self.rect.height, 12,
+                                  Colors.BG_PANEL, Colors.BORDER_DEFAULT, 1),
+                     self._pg_rect)
         
         # Title
         if self.title:
-            font = FontManager.get('heading')
-            title_surface = font.render(self.title, True, Colors.TEXT_PRIMARY)
+            title_surface = render_text('heading', self.title, Colors.TEXT_PRIMARY)
             surface.blit(title_surface, (self.rect.x + self.padding, 
                                          self.rect.y + self.padding))
+    
+    def draw_content(self, surface: pygame.Surface) -> None:
+        """Draw what sits on top of the background. Extend in subclasses."""
+        if not self.visible:
+            return
         
-        # Draw children
-        for child in self.children:
-            child.draw(surface)
+        # Draw children, skipping those outside the damaged (clip) region
+        damage = surface.get_clip()
+        child_visible = self._child_visible
+        child_rects = self._child_rects
+        for i, draw_fn in enumerate(self._child_draw):
+            if child_visible[i] and child_rects[i].colliderect(damage):
+                draw_fn(surface)
     
     def handle_event(self, event: pygame.event.Event) -> bool:
-        for child in reversed(self.children):
-            if child.handle_event(event):
+        if not self.visible:
+            return False
+        
+        handler = self._event_handlers.get(event.type)
+        if handler and handler(event):
+            return True
+        
+        # Mouse motion outside the panel only matters to children on the
+        # first event after the pointer leaves (so hover states can reset)
+        if event.type == pygame.MOUSEMOTION:
+            inside = self._pg_rect.collidepoint(event.pos)
+            was_inside = self._pointer_inside
+            self._pointer_inside = inside
+            if not inside and not was_inside:
+                return False
+        
+        for handle_fn in reversed(self._child_handle):
+            if handle_fn(event):
                 return True
         return False
     
     def update(self, dt: float) -> None:
-        for child in self.children:
-            child.update(dt)
+        for update_fn in self._child_update:
+            update_fn(dt)
 
 
 class ValidationPanel(Panel):
     """Panel for displaying validation results."""
     
+    TRACE_LINE_HEIGHT = 20
+    
     def __init__(self, x: int, y: int, width: int, height: int):
         super().__init__(x, y, width, height, "Validation Result", 16)
         self.is_valid = None
         self.message = ""
-        self.trace: List[str] = []
+        self.trace: Tuple[str, ...] = ()
         self.scroll_offset = 0
+        # Trace lines cut to the displayable width, and the rendered window
+        # of them currently in view keyed by (scroll_offset, line count)
+        self._trace_lines: Tuple[str, ...] = ()
+        self._trace_surface: Optional[pygame.Surface] = None
+        self._trace_window: Optional[Tuple[int, int]] = None
+        
+        # Status icons (filled circle + checkmark/cross) are static, so
+        # render both variants once
+        self._icon_size = 28
+        self._valid_icon = self._make_icon(Colors.ACCENT_SUCCESS, True)
+        self._invalid_icon = self._make_icon(Colors.ACCENT_ERROR, False)
+        self._event_handlers = {pygame.MOUSEWHEEL: self._on_wheel}
+    
+    def _make_icon(self, circle_color: Tuple[int, int, int], valid: bool) -> pygame.Surface:
+        """Render a status icon onto a transparent surface."""
+        size = self._icon_size
+        icon = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(icon, circle_color, (size // 2, size // 2), size // 2)
+        if valid:
+            self._draw_checkmark(icon, 0, 0, size, Colors.TEXT_DARK)
+        else:
+            self._draw_cross(icon, 0, 0, size, Colors.TEXT_PRIMARY)
+        return _display_format(icon)
     
     def set_result(self, is_valid: bool, message: str, trace: List[str]):
         """Set the validation result to display."""
         self.is_valid = is_valid
         self.message = message
-        self.trace = trace
+        self.trace = tuple(trace)
+        self._trace_lines = tuple(line[:80] for line in self.trace)
         self.scroll_offset = 0
+        self._trace_surface = None
+        self._trace_window = None
+        self._dirty = True
     
     def clear(self):
         """Clear the validation result."""
         self.is_valid = None
         self.message = ""
-        self.trace = []
+        self.trace = ()
+        self._trace_lines = ()
+        self._trace_surface = None
+        self._trace_window = None
+        self._dirty = True
+    
+    def _render_trace(self, trace: Tuple[str, ...]) -> Optional[pygame.Surface]:
+        """
+        Render trace lines into one transparent surface.
+        
+        Only the lines in view are passed in, so long traces never
+        materialize more than a viewport's worth of text.
+        """
+        if not trace:
+            return None
+        lines = [render_text('mono_small', line, Colors.TEXT_SECONDARY)
+                 for line in trace]
+        line_height = self.TRACE_LINE_HEIGHT
+        composite = pygame.Surface((max(line.get_width() for line in lines),
+                                    line_height * len(lines)), pygame.SRCALPHA)
+        composite.blits([(line, (0, i * line_height)) for i, line in enumerate(lines)],
+                        doreturn=False)
+        return _display_format(composite)
     
     def _draw_checkmark(self, surface: pygame.Surface, x: int, y: int, size: int, color: Tuple[int, int, int]):
         """Draw a checkmark icon."""
@@ -662,8 +1110,8 @@ class ValidationPanel(Panel):
                         (x + size - margin, y + margin), 
                         (x + margin, y + size - margin), 4)
     
-    def draw(self, surface: pygame.Surface) -> None:
-        super().draw(surface)
+    def draw_content(self, surface: pygame.Surface) -> None:
+        super().draw_content(surface)
         
         if not self.visible:
             return
@@ -674,62 +1122,57 @@ class ValidationPanel(Panel):
             # Status indicator with icon
             status_color = Colors.ACCENT_SUCCESS if self.is_valid else Colors.ACCENT_ERROR
             
-            # Draw icon circle background
-            icon_size = 28
+            # Draw pre-rendered icon (circle with checkmark or cross)
+            icon_size = self._icon_size
             icon_x = self.rect.x + self.padding
             icon_y = content_y
-            
-            # Draw filled circle
-            center = (icon_x + icon_size // 2, icon_y + icon_size // 2)
-            pygame.draw.circle(surface, status_color, center, icon_size // 2)
-            
-            # Draw icon (checkmark or cross)
-            if self.is_valid:
-                self._draw_checkmark(surface, icon_x, icon_y, icon_size, Colors.TEXT_DARK)
-            else:
-                self._draw_cross(surface, icon_x, icon_y, icon_size, Colors.TEXT_PRIMARY)
+            icon = self._valid_icon if self.is_valid else self._invalid_icon
+            surface.blit(icon, (icon_x, icon_y))
             
             # Draw status text
             status_text = "VALID" if self.is_valid else "INVALID"
-            font = FontManager.get('heading')
-            status_surface = font.render(status_text, True, status_color)
-            surface.blit(status_surface, (icon_x + icon_size + 12, content_y))
+            status_surface = render_text('heading', status_text, status_color)
+            status_pos = (icon_x + icon_size + 12, content_y)
             content_y += 40
             
             # Message
-            font = FontManager.get('body')
-            msg_surface = font.render(self.message, True, Colors.TEXT_SECONDARY)
-            surface.blit(msg_surface, (self.rect.x + self.padding, content_y))
+            msg_surface = render_text('body', self.message, Colors.TEXT_SECONDARY)
+            surface.blits(((status_surface, status_pos),
+                           (msg_surface, (self.rect.x + self.padding, content_y))),
+                          doreturn=False)
             content_y += 32
             
             # Trace (scrollable)
-            if self.trace:
+            if self._trace_lines:
                 trace_rect = pygame.Rect(self.rect.x + self.padding, content_y,
                                         self.rect.width - 2*self.padding,
                                         self.rect.height - (content_y - self.rect.y) - self.padding)
                 
                 pygame.draw.rect(surface, Colors.BG_DARK, trace_rect, border_radius=6)
                 
-                font = FontManager.get('mono_small')
-                surface.set_clip(trace_rect.inflate(-8, -8))
-                
-                line_height = 20
+                line_height = self.TRACE_LINE_HEIGHT
                 visible_lines = (trace_rect.height - 16) // line_height
                 
-                for i, line in enumerate(self.trace[self.scroll_offset:self.scroll_offset + visible_lines]):
-                    y = content_y + 8 + i * line_height
-                    line_surface = font.render(line[:80], True, Colors.TEXT_SECONDARY)
-                    surface.blit(line_surface, (self.rect.x + self.padding + 8, y))
-                
-                surface.set_clip(None)
+                # Re-render the window only when scrolling moved it
+                window = (self.scroll_offset, visible_lines)
+                if window != self._trace_window:
+                    self._trace_surface = self._render_trace(
+                        self._trace_lines[self.scroll_offset:self.scroll_offset + visible_lines])
+                    self._trace_window = window
+                if self._trace_surface is not None:
+                    _blit_clipped(surface, self._trace_surface,
+                                  (self.rect.x + self.padding + 8, content_y + 8),
+                                  trace_rect.inflate(-8, -8))
     
-    def handle_event(self, event: pygame.event.Event) -> bool:
-        if event.type == pygame.MOUSEWHEEL:
-            if self.rect.contains(pygame.mouse.get_pos()):
-                self.scroll_offset = max(0, min(len(self.trace) - 5, 
-                                               self.scroll_offset - event.y))
-                return True
-        return super().handle_event(event)
+    def _on_wheel(self, event: pygame.event.Event) -> bool:
+        if not self._pg_rect.collidepoint(pygame.mouse.get_pos()):
+            return False
+        scroll_offset = max(0, min(len(self.trace) - 5,
+                                   self.scroll_offset - event.y))
+        if scroll_offset != self.scroll_offset:
+            self.scroll_offset = scroll_offset
+            self._dirty = True
+        return True
 
 
 class ConversionPanel(Panel):
@@ -739,6 +1182,7 @@ class ConversionPanel(Panel):
         super().__init__(x, y, width, height, "Conversion Results", 16)
         self.results: Dict[str, str] = {}
         self.scroll_offset = 0
+        self._results_surface: Optional[pygame.Surface] = None
     
     def set_results(self, infix: str = "", postfix: str = "", prefix: str = ""):
         """Set the conversion results."""
@@ -747,39 +1191,49 @@ class ConversionPanel(Panel):
             "Postfix": postfix,
             "Prefix": prefix
         }
+        self._results_surface = self._render_results()
+        self._dirty = True
     
     def clear(self):
         """Clear all results."""
         self.results = {}
+        self._results_surface = None
+        self._dirty = True
     
-    def draw(self, surface: pygame.Surface) -> None:
-        super().draw(surface)
-        
-        if not self.visible or not self.results:
-            return
-        
-        content_y = self.rect.y + 56
-        font_label = FontManager.get('body')
-        font_value = FontManager.get('mono')
+    def _render_results(self) -> pygame.Surface:
+        """Render the label and value box rows into one transparent surface."""
+        width = self.rect.width - 2*self.padding
+        composite = pygame.Surface((width, 72 * len(self.results)), pygame.SRCALPHA)
         
+        blits = []
+        content_y = 0
         for notation, value in self.results.items():
             # Label
-            label_surface = font_label.render(f"{notation}:", True, Colors.TEXT_SECONDARY)
-            surface.blit(label_surface, (self.rect.x + self.padding, content_y))
+            label_surface = render_text('body', f"{notation}:", Colors.TEXT_SECONDARY)
+            blits.append((label_surface, (0, content_y)))
             
             # Value box
-            value_rect = pygame.Rect(self.rect.x + self.padding, content_y + 24,
-                                    self.rect.width - 2*self.padding, 36)
-            pygame.draw.rect(surface, Colors.BG_DARK, value_rect, border_radius=6)
+            value_rect = pygame.Rect(0, content_y + 24, width, 36)
+            pygame.draw.rect(composite, Colors.BG_DARK, value_rect, border_radius=6)
             
             if value:
-                value_surface = font_value.render(value[:50], True, Colors.ACCENT_PRIMARY)
-                surface.blit(value_surface, (value_rect.x + 12, value_rect.y + 8))
+                value_surface = render_text('mono', value[:50], Colors.ACCENT_PRIMARY)
             else:
-                empty_surface = font_value.render("-", True, Colors.TEXT_MUTED)
-                surface.blit(empty_surface, (value_rect.x + 12, value_rect.y + 8))
+                value_surface = render_text('mono', "-", Colors.TEXT_MUTED)
+            blits.append((value_surface, (value_rect.x + 12, value_rect.y + 8)))
             
             content_y += 72
+        
+        composite.blits(blits, doreturn=False)
+        return _display_format(composite)
+    
+    def draw_content(self, surface: pygame.Surface) -> None:
+        super().draw_content(surface)
+        
+        if not self.visible or self._results_surface is None:
+            return
+        
+        surface.blit(self._results_surface, (self.rect.x + self.padding, self.rect.y + 56))
 
 
 class StateVisualizer(Component):
@@ -790,47 +1244,37 @@ class StateVisualizer(Component):
         self.states: List[Dict] = []
         self.transitions: List[Dict] = []
         self.current_state_name: Optional[str] = None
-        self.animation_progress = 0.0
+        # Layout derived from the PDA data, rebuilt by set_pda_data
+        self._pda_data: Optional[Dict] = None
+        self._state_positions: Dict[str, Tuple[int, int]] = {}
+        # Per-state draw data as parallel tuples, indexed like self.states
+        self._names: Tuple[str, ...] = ()
+        self._is_accepting: Tuple[bool, ...] = ()
+        self._is_error: Tuple[bool, ...] = ()
+        self._is_initial: Tuple[bool, ...] = ()
+        self._sprite_key: Tuple[Tuple[bool, bool, bool], ...] = ()
+        self._sprite_pos: Tuple[Tuple[int, int], ...] = ()
+        self._name_surfaces: Tuple[pygame.Surface, ...] = ()
+        self._name_pos: Tuple[pygame.Rect, ...] = ()
+        self._transition_lines: List[Tuple[Tuple[int, int], Tuple[int, int]]] = []
+        self._transition_surface: Optional[pygame.Surface] = None
+        # Rendered state circles keyed by (is_current, is_accepting,
+        # is_error, is_initial); the look depends on nothing else
+        self._sprite_cache: Dict[Tuple[bool, bool, bool, bool], pygame.Surface] = {}
     
     def set_pda_data(self, data: Dict):
         """Set the PDA data for visualization."""
         self.states = data.get('states', [])
         self.transitions = data.get('transitions', [])
+        # The same diagram dict always lays out the same way
+        if data is not self._pda_data:
+            self._pda_data = data
+            self._layout()
+        self._dirty = True
     
-    def set_current_state(self, state_name: str):
-        """Highlight the current state."""
-        self.current_state_name = state_name
-        self.animation_progress = 0.0
-    
-    def draw(self, surface: pygame.Surface) -> None:
-        if not self.visible:
-            return
-        
-        # Background
-        pygame.draw.rect(surface, Colors.BG_PANEL, self.rect.to_pygame(), border_radius=12)
-        pygame.draw.rect(surface, Colors.BORDER_DEFAULT, self.rect.to_pygame(),
-                        width=1, border_radius=12)
-        
-        # Title
-        font = FontManager.get('heading')
-        title = font.render("PDA State Diagram", True, Colors.TEXT_PRIMARY)
-        surface.blit(title, (self.rect.x + 16, self.rect.y + 16))
-        
-        if not self.states:
-            # Show placeholder
-            font = FontManager.get('body')
-            placeholder = font.render("Enter expression and validate to see states", 
-                                     True, Colors.TEXT_MUTED)
-            placeholder_rect = placeholder.get_rect(center=self.rect.to_pygame().center)
-            surface.blit(placeholder, placeholder_rect)
-            return
-        
-        # Calculate state positions
+    def _layout(self) -> None:
+        """Compute state positions, name labels and transition segments."""
         num_states = len(self.states)
-        if num_states == 0:
-            return
-        
-        state_radius = 30
         center_x = self.rect.x + self.rect.width // 2
         center_y = self.rect.y + self.rect.height // 2 + 20
         
@@ -844,71 +1288,140 @@ class StateVisualizer(Component):
                 state_positions[state['name']] = (start_x + i * spacing, center_y)
         else:
             # Circular layout
-            import math
             radius = min(self.rect.width, self.rect.height) // 3
             for i, state in enumerate(self.states):
                 angle = 2 * math.pi * i / num_states - math.pi / 2
                 x = center_x + int(radius * math.cos(angle))
                 y = center_y + int(radius * math.sin(angle))
                 state_positions[state['name']] = (x, y)
+        self._state_positions = state_positions
         
-        # Draw transitions first (so they're behind states)
+        states = self.states
+        self._names = names = tuple(state['name'] for state in states)
+        self._is_accepting = tuple(bool(state.get('is_accepting')) for state in states)
+        self._is_error = tuple(state.get('type') == 'ERROR' for state in states)
+        self._is_initial = tuple(bool(state.get('is_initial')) for state in states)
+        self._sprite_key = tuple(zip(self._is_accepting, self._is_error, self._is_initial))
+        
+        state_radius = 30
+        positions = tuple(state_positions[name] for name in names)
+        self._sprite_pos = tuple((x - state_radius - 20, y - state_radius - 5)
+                                 for x, y in positions)
+        self._name_surfaces = tuple(
+            render_text('small', name.replace('q_', '')[:8], Colors.TEXT_DARK)
+            for name in names
+        )
+        self._name_pos = tuple(text.get_rect(center=pos)
+                               for text, pos in zip(self._name_surfaces, positions))
+        
+        self._transition_lines = []
         for trans in self.transitions:
             from_pos = state_positions.get(trans['from'])
             to_pos = state_positions.get(trans['to'])
             if from_pos and to_pos:
-                # Draw arrow
-                pygame.draw.line(surface, Colors.TEXT_MUTED, from_pos, to_pos, 2)
-        
-        # Draw states
-        font = FontManager.get('small')
-        for state in self.states:
-            pos = state_positions.get(state['name'])
-            if not pos:
-                continue
-            
-            # Determine color
-            if state['name'] == self.current_state_name:
-                color = Colors.STATE_CURRENT
-                outline_color = Colors.ACCENT_PRIMARY
-            elif state.get('is_accepting'):
-                color = Colors.STATE_ACCEPT
-                outline_color = Colors.STATE_ACCEPT
-            elif state.get('type') == 'ERROR':
-                color = Colors.STATE_ERROR
-                outline_color = Colors.STATE_ERROR
-            elif state.get('is_initial'):
-                color = Colors.STATE_INITIAL
-                outline_color = Colors.STATE_INITIAL
-            else:
-                color = Colors.STATE_NORMAL
-                outline_color = Colors.TEXT_MUTED
-            
-            # Draw state circle
-            pygame.draw.circle(surface, color, pos, state_radius)
-            pygame.draw.circle(surface, outline_color, pos, state_radius, 3)
-            
-            # Double circle for accepting states
-            if state.get('is_accepting'):
-                pygame.draw.circle(surface, outline_color, pos, state_radius - 5, 2)
-            
-            # Arrow for initial state
-            if state.get('is_initial'):
-                arrow_start = (pos[0] - state_radius - 20, pos[1])
-                arrow_end = (pos[0] - state_radius - 5, pos[1])
-                pygame.draw.line(surface, outline_color, arrow_start, arrow_end, 2)
-                pygame.draw.polygon(surface, outline_color, [
-                    arrow_end,
-                    (arrow_end[0] - 8, arrow_end[1] - 5),
-                    (arrow_end[0] - 8, arrow_end[1] + 5)
-                ])
-            
-            # State name
-            name_short = state['name'].replace('q_', '')[:8]
-            text_surface = font.render(name_short, True, Colors.TEXT_DARK)
-            text_rect = text_surface.get_rect(center=pos)
-            surface.blit(text_surface, text_rect)
+                self._transition_lines.append((from_pos, to_pos))
+        
+        # The segments are disjoint, so they can't go out as one polyline;
+        # draw them once onto an overlay that draw() blits in one go
+        overlay = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
+        origin_x, origin_y = self.rect.x, self.rect.y
+        for (x1, y1), (x2, y2) in self._transition_lines:
+            pygame.draw.line(overlay, Colors.TEXT_MUTED,
+                             (x1 - origin_x, y1 - origin_y),
+                             (x2 - origin_x, y2 - origin_y), 2)
+        self._transition_surface = _display_format(overlay)
     
-    def update(self, dt: float) -> None:
-        self.animation_progress = min(1.0, self.animation_progress + dt * 2)
+    def set_current_state(self, state_name: str):
+        """Highlight the current state."""
+        self.current_state_name = state_name
+        self._dirty = True
+    
+    def draw(self, surface: pygame.Surface) -> None:
+        if not self.visible:
+            return
+        
+        # Background
+        surface.blit(_rounded_box(self.rect.width, self.rect.height, 12,
+                                  Colors.BG_PANEL, Colors.BORDER_DEFAULT, 1),
+                     self._pg_rect)
+        
+        # Title
+        title = render_text('heading', "PDA State Diagram", Colors.TEXT_PRIMARY)
+        surface.blit(title, (self.rect.x + 16, self.rect.y + 16))
+        
+        if not self.states:
+            # Show placeholder
+            placeholder = render_text('body', "Enter expression and validate to see states",
+                                      Colors.TEXT_MUTED)
+            placeholder_rect = placeholder.get_rect(center=self._pg_rect.center)
+            surface.blit(placeholder, placeholder_rect)
+            return
+        
+        # Draw transitions first (so they're behind states)
+        if self._transition_surface is not None:
+            surface.blit(self._transition_surface, self._pg_rect)
+        
+        # Draw states from pre-rendered sprites, each followed by its name
+        current = self.current_state_name
+        sprite_cache = self._sprite_cache
+        sprite_key = self._sprite_key
+        sprite_pos = self._sprite_pos
+        name_surfaces = self._name_surfaces
+        name_pos = self._name_pos
+        blits = []
+        for i, name in enumerate(self._names):
+            key = (name == current,) + sprite_key[i]
+            sprite = sprite_cache.get(key)
+            if sprite is None:
+                sprite = sprite_cache[key] = self._make_state_sprite(*key)
+            blits.append((sprite, sprite_pos[i]))
+            blits.append((name_surfaces[i], name_pos[i]))
+        surface.blits(blits, doreturn=False)
+    
+    def _make_state_sprite(self, is_current: bool, is_accepting: bool,
+                           is_error: bool, is_initial: bool) -> pygame.Surface:
+        """Render one state circle (with its initial-state arrow) to a sprite."""
+        state_radius = 30
+        
+        # Determine color
+        if is_current:
+            color = Colors.STATE_CURRENT
+            outline_color = Colors.ACCENT_PRIMARY
+        elif is_accepting:
+            color = Colors.STATE_ACCEPT
+            outline_color = Colors.STATE_ACCEPT
+        elif is_error:
+            color = Colors.STATE_ERROR
+            outline_color = Colors.STATE_ERROR
+        elif is_initial:
+            color = Colors.STATE_INITIAL
+            outline_color = Colors.STATE_INITIAL
+        else:
+            color = Colors.STATE_NORMAL
+            outline_color = Colors.TEXT_MUTED
+        
+        # 20px margin on the left for the initial-state arrow
+        sprite = pygame.Surface((2 * state_radius + 40, 2 * state_radius + 10), pygame.SRCALPHA)
+        pos = (state_radius + 20, state_radius + 5)
+        
+        # Draw state circle
+        pygame.draw.circle(sprite, color, pos, state_radius)
+        pygame.draw.circle(sprite, outline_color, pos, state_radius, 3)
+        
+        # Double circle for accepting states
+        if is_accepting:
+            pygame.draw.circle(sprite, outline_color, pos, state_radius - 5, 2)
+        
+        # Arrow for initial state
+        if is_initial:
+            arrow_start = (pos[0] - state_radius - 20, pos[1])
+            arrow_end = (pos[0] - state_radius - 5, pos[1])
+            pygame.draw.line(sprite, outline_color, arrow_start, arrow_end, 2)
+            pygame.draw.polygon(sprite, outline_color, [
+                arrow_end,
+                (arrow_end[0] - 8, arrow_end[1] - 5),
+                (arrow_end[0] - 8, arrow_end[1] + 5)
+            ])
+        
+        return _display_format(sprite)
 
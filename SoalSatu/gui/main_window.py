@@ -5,13 +5,15 @@ This module provides the main application window that integrates
 all UI components for expression validation and conversion.
 """
 
-from expression_converter import ExpressionConverter, ConversionResult
+from expression_converter import (
+    ExpressionConverter, ConversionResult, convert_to_all_notations
+)
 from expression_validator import (
     ExpressionValidator, NotationType, ValidationResult
 )
 import pygame
 import sys
-from typing import Optional
+from typing import Dict, List, Optional
 
 from .components import (
     Colors, FontManager, Label, Button, InputField, Dropdown,
@@ -38,16 +40,41 @@ class MainWindow:
     WINDOW_HEIGHT = 800
     FPS = 60
 
+    # Partial repaints are only worth it for a few small regions;
+    # otherwise repaint everything and flip
+    MAX_DAMAGE_RECTS = 4
+    MAX_DAMAGE_FRACTION = 0.25
+
+    # Notation per toggle button index, and the input hint for each
+    _NOTATION_BY_INDEX = (NotationType.INFIX, NotationType.POSTFIX,
+                          NotationType.PREFIX)
+    _PLACEHOLDERS = {
+        NotationType.INFIX: "Enter expression (e.g., (3+4)*2)",
+        NotationType.POSTFIX: "Enter expression (e.g., 3 4 + 2 *)",
+        NotationType.PREFIX: "Enter expression (e.g., * + 3 4 2)"
+    }
+
     def __init__(self):
         """Initialize the main window."""
         pygame.init()
         pygame.display.set_caption("PDA Expression Validator & Converter")
 
-        self.screen = pygame.display.set_mode(
-            (self.WINDOW_WIDTH, self.WINDOW_HEIGHT)
-        )
+        # Let SDL present through the GPU with vsync where it can; some
+        # drivers refuse the renderer, so fall back to a plain window
+        try:
+            self.screen = pygame.display.set_mode(
+                (self.WINDOW_WIDTH, self.WINDOW_HEIGHT),
+                pygame.SCALED | pygame.DOUBLEBUF, vsync=1
+            )
+        except pygame.error:
+            self.screen = pygame.display.set_mode(
+                (self.WINDOW_WIDTH, self.WINDOW_HEIGHT)
+            )
         self.clock = pygame.time.Clock()
         self.running = True
+        # Set by window-level changes that need a repaint; components
+        # track their own changes via is_dirty()
+        self._dirty = True
 
         # Initialize font manager
         FontManager.init()
@@ -59,10 +86,25 @@ class MainWindow:
         # Current state
         self.current_notation = NotationType.INFIX
         self.last_validation: Optional[ValidationResult] = None
+        # Diagram data per notation; a PDA's structure never changes
+        # after the validator builds it
+        self._diagram_cache: Dict[NotationType, Dict] = {}
 
         # Initialize UI components
         self._init_components()
 
+        # Status bar background strip
+        self._status_bg = pygame.Surface((self.WINDOW_WIDTH, 50))
+        self._status_bg.fill(Colors.BG_MEDIUM)
+
+        # Gradient accent line at the top, pre-rendered as a 4px strip
+        self._accent_strip = pygame.Surface((self.WINDOW_WIDTH, 4))
+        for i in range(4):
+            color = tuple(min(255, c + 50 - i * 15)
+                          for c in Colors.ACCENT_PRIMARY)
+            pygame.draw.line(self._accent_strip, color, (0, i),
+                             (self.WINDOW_WIDTH, i))
+
     def _init_components(self):
         """Initialize all UI components."""
         # Title
@@ -93,7 +135,7 @@ class MainWindow:
 
         self.expression_input = InputField(
             180, 233, 400, 44,
-            placeholder="Enter expression (e.g., (3+4)*2)",
+            placeholder=self._PLACEHOLDERS[NotationType.INFIX],
             on_submit=self._on_validate
         )
 
@@ -106,16 +148,20 @@ class MainWindow:
         # Quick examples panel
         self.examples_panel = Panel(780, 120, 380, 180, "Quick Examples", 20)
 
-        self.example_buttons = [
-            Button(800, 175, 160, 36, "(3+4)*2",
-                   on_click=lambda: self._set_example("(3+4)*2", 0), style='secondary'),
-            Button(980, 175, 160, 36, "((5-3)*2)+1",
-                   on_click=lambda: self._set_example("((5-3)*2)+1", 0), style='secondary'),
-            Button(800, 220, 160, 36, "3 4 + 2 *",
-                   on_click=lambda: self._set_example("3 4 + 2 *", 1), style='secondary'),
-            Button(980, 220, 160, 36, "* + 3 4 2",
-                   on_click=lambda: self._set_example("* + 3 4 2", 2), style='secondary'),
-        ]
+        def on_example(expression: str, notation_index: int):
+            return lambda: self._set_example(expression, notation_index)
+
+        examples = (
+            (800, 175, "(3+4)*2", 0),
+            (980, 175, "((5-3)*2)+1", 0),
+            (800, 220, "3 4 + 2 *", 1),
+            (980, 220, "* + 3 4 2", 2),
+        )
+        self.example_buttons = tuple(
+            Button(x, y, 160, 36, expression,
+                   on_click=on_example(expression, notation_index), style='secondary')
+            for x, y, expression, notation_index in examples
+        )
 
         # Validation results panel
         self.validation_panel = ValidationPanel(40, 320, 560, 260)
@@ -139,31 +185,50 @@ class MainWindow:
             font_name='small', color=Colors.TEXT_MUTED
         )
 
-        # Collect all components for event handling
-        self.components = [
+        # Collect all components for event handling. Order matters: the
+        # input field consumes the click that takes its focus away, so it
+        # must come after the notation buttons
+        self.components = (
             self.notation_buttons,
             self.expression_input,
             self.validate_button,
             self.clear_button,
             self.validation_panel,
             self.conversion_panel,
-        ] + self.example_buttons
+            *self.example_buttons,
+        )
+        # Mouse motion is only dispatched to components that track hover
+        self._motion_components = tuple(
+            c for c in self.components if c.handles(pygame.MOUSEMOTION))
+
+        # Everything _draw paints, for checking whether a repaint is needed
+        self._drawables = [
+            self.title_label, self.subtitle_label,
+            self.input_panel, self.examples_panel,
+            self.notation_label, self.expression_label,
+            self.state_visualizer, self.status_label,
+            *self.components,
+        ]
+        # Components that only ever appear in the pre-rendered chrome
+        self._chrome_components = (
+            self.title_label, self.subtitle_label,
+            self.input_panel, self.examples_panel,
+            self.notation_label, self.expression_label,
+        )
+        self._chrome: Optional[pygame.Surface] = None
+        # Screen area each component covered when last drawn, so a change
+        # that shrinks it (e.g. shorter label text) still clears the old area
+        self._drawn_rects = {c: c._pg_rect.copy() for c in self._drawables}
 
     def _on_notation_change(self, index: int, value: str):
         """Handle notation type change."""
-        notation_map = {
-            0: NotationType.INFIX,
-            1: NotationType.POSTFIX,
-            2: NotationType.PREFIX
-        }
-        self.current_notation = notation_map.get(index, NotationType.INFIX)
-
-        placeholders = {
-            NotationType.INFIX: "Enter expression (e.g., (3+4)*2)",
-            NotationType.POSTFIX: "Enter expression (e.g., 3 4 + 2 *)",
-            NotationType.PREFIX: "Enter expression (e.g., * + 3 4 2)"
-        }
-        self.expression_input.placeholder = placeholders[self.current_notation]
+        if 0 <= index < len(self._NOTATION_BY_INDEX):
+            self.current_notation = self._NOTATION_BY_INDEX[index]
+        else:
+            self.current_notation = NotationType.INFIX
+
+        self.expression_input.placeholder = self._PLACEHOLDERS[self.current_notation]
+        self._dirty = True
 
         self.status_label.set_text(f"Notation changed to {value}")
 
@@ -173,6 +238,7 @@ class MainWindow:
         self._on_notation_change(
             notation_index, self.notation_buttons.options[notation_index])
         self.expression_input.set_text(expression)
+        self._dirty = True
         self._on_validate()
 
     def _on_validate(self, text: str = None):
@@ -186,6 +252,7 @@ class MainWindow:
         # Validate
         result = self.validator.validate(expression, self.current_notation)
         self.last_validation = result
+        self._dirty = True
 
         # Update validation panel
         self.validation_panel.set_result(
@@ -195,9 +262,13 @@ class MainWindow:
         )
 
         # Update state visualizer
-        pda = self.validator.get_pda(self.current_notation)
-        if pda:
-            self.state_visualizer.set_pda_data(pda.get_diagram_data())
+        diagram = self._diagram_cache.get(self.current_notation)
+        if diagram is None:
+            pda = self.validator.get_pda(self.current_notation)
+            if pda:
+                diagram = self._diagram_cache[self.current_notation] = pda.get_diagram_data()
+        if diagram is not None:
+            self.state_visualizer.set_pda_data(diagram)
             self.state_visualizer.set_current_state(result.final_state)
 
         # If valid, also convert to other notations
@@ -211,13 +282,13 @@ class MainWindow:
 
     def _perform_conversions(self, expression: str):
         """Convert valid expression to all notations."""
-        results = self.converter.convert_to_all(
+        infix, postfix, prefix = convert_to_all_notations(
             expression, self.current_notation)
 
         self.conversion_panel.set_results(
-            infix=results[NotationType.INFIX].result_expression,
-            postfix=results[NotationType.POSTFIX].result_expression,
-            prefix=results[NotationType.PREFIX].result_expression
+            infix=infix,
+            postfix=postfix,
+            prefix=prefix
         )
 
     def _on_clear(self):
@@ -227,6 +298,7 @@ class MainWindow:
         self.conversion_panel.clear()
         self.state_visualizer.states = []
         self.last_validation = None
+        self._dirty = True
         self.status_label.set_text("Cleared - Ready for new expression")
 
     def _handle_events(self):
@@ -241,8 +313,16 @@ class MainWindow:
                     self.running = False
                     return
 
+            # The window was uncovered; its contents must be repainted
+            if event.type == pygame.WINDOWEXPOSED:
+                self._dirty = True
+
             # Pass events to components
-            for component in self.components:
+            if event.type == pygame.MOUSEMOTION:
+                components = self._motion_components
+            else:
+                components = self.components
+            for component in components:
                 if component.handle_event(event):
                     break
 
@@ -250,56 +330,102 @@ class MainWindow:
         """Update components."""
         for component in self.components:
             component.update(dt)
-        self.state_visualizer.update(dt)
-
-    def _draw(self):
-        """Draw all components."""
-        # Clear screen with background
-        self.screen.fill(Colors.BG_DARK)
 
-        # Draw gradient accent line at top
-        for i in range(4):
-            alpha = 255 - i * 60
-            color = tuple(min(255, c + 50 - i * 15)
-                          for c in Colors.ACCENT_PRIMARY)
-            pygame.draw.line(self.screen, color, (0, i),
-                             (self.WINDOW_WIDTH, i))
+    def _needs_redraw(self) -> bool:
+        """Check whether anything changed since the last frame was drawn."""
+        return self._dirty or any(c.is_dirty() for c in self._drawables)
+
+    def _damage_rects(self) -> Optional[List[pygame.Rect]]:
+        """
+        Return the screen regions that need repainting.
+
+        Returns None when a full repaint is cheaper: after window-level
+        changes, or when the damage is spread over too many or too large
+        regions.
+        """
+        if self._dirty:
+            return None
+        damage = []
+        for component in self._drawables:
+            if component.is_dirty():
+                damage.append(component._pg_rect.union(self._drawn_rects[component]))
+        if len(damage) > self.MAX_DAMAGE_RECTS:
+            return None
+        area = sum(rect.width * rect.height for rect in damage)
+        if area > self.MAX_DAMAGE_FRACTION * self.WINDOW_WIDTH * self.WINDOW_HEIGHT:
+            return None
+        return damage
+
+    def _build_chrome(self):
+        """
+        Pre-render everything static into one window-sized surface.
+
+        Covers the background, accent line, title labels, the input and
+        examples panels with their labels, and the frames of the result
+        panels; _paint blits it instead of drawing each of them.
+        """
+        chrome = pygame.Surface((self.WINDOW_WIDTH, self.WINDOW_HEIGHT))
+        chrome.fill(Colors.BG_DARK)
+        chrome.blit(self._accent_strip, (0, 0))
+        for component in self._chrome_components:
+            component.draw(chrome)
+        self.validation_panel.draw_background(chrome)
+        self.conversion_panel.draw_background(chrome)
+        self._chrome = chrome
 
-        # Draw title and subtitle
-        self.title_label.draw(self.screen)
-        self.subtitle_label.draw(self.screen)
-
-        # Draw panels
-        self.input_panel.draw(self.screen)
-        self.examples_panel.draw(self.screen)
+    def _draw(self):
+        """Draw all changed regions and push them to the display."""
+        if self._chrome is None or any(
+                c.is_dirty() for c in self._chrome_components):
+            self._build_chrome()
+            self._dirty = True
+
+        damage = self._damage_rects()
+        if damage is None:
+            self._paint()
+            pygame.display.flip()
+        elif damage:
+            # Repaint each region under a clip; blits outside it are
+            # rejected and panels skip children outside it
+            for rect in damage:
+                self.screen.set_clip(rect)
+                self._paint()
+            self.screen.set_clip(None)
+            pygame.display.update(damage)
+
+        self._dirty = False
+        for component in self._drawables:
+            if component.is_dirty():
+                self._drawn_rects[component] = component._pg_rect.copy()
+            component.mark_clean()
+
+    def _paint(self):
+        """Paint the whole window onto the screen surface (respecting its clip)."""
+        # Static background, panels and labels
+        self.screen.blit(self._chrome, (0, 0))
 
         # Draw input components
-        self.notation_label.draw(self.screen)
         self.notation_buttons.draw(self.screen)
-        self.expression_label.draw(self.screen)
         self.expression_input.draw(self.screen)
         self.validate_button.draw(self.screen)
         self.clear_button.draw(self.screen)
 
-        # Draw example buttons
-        for btn in self.example_buttons:
-            btn.draw(self.screen)
+        # Draw example buttons as one batch of pre-composed faces
+        self.screen.blits([(btn.face(), btn._pg_rect)
+                           for btn in self.example_buttons if btn.visible],
+                          doreturn=False)
 
-        # Draw result panels
-        self.validation_panel.draw(self.screen)
-        self.conversion_panel.draw(self.screen)
+        # Draw result panel contents (their frames are in the chrome)
+        self.validation_panel.draw_content(self.screen)
+        self.conversion_panel.draw_content(self.screen)
 
         # Draw state visualizer
         self.state_visualizer.draw(self.screen)
 
         # Draw status bar
-        pygame.draw.rect(self.screen, Colors.BG_MEDIUM,
-                         pygame.Rect(0, self.WINDOW_HEIGHT - 50, self.WINDOW_WIDTH, 50))
+        self.screen.blit(self._status_bg, (0, self.WINDOW_HEIGHT - 50))
         self.status_label.draw(self.screen)
 
-        # Update display
-        pygame.display.flip()
-
     def run(self):
         """Run the main application loop."""
         while self.running:
@@ -307,6 +433,9 @@ class MainWindow:
 
             self._handle_events()
             self._update(dt)
-            self._draw()
+            # A static screen is left as is; the clock still caps the
+            # loop rate so idle frames just sleep
+            if self._needs_redraw():
+                self._draw()
 
         pygame.quit()
@@ -23,7 +23,9 @@ import sys
 import os
 
 # Add current directory to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+_here = os.path.dirname(os.path.abspath(__file__))
+if _here not in sys.path:
+    sys.path.insert(0, _here)
 
 from expression_validator import (
     ExpressionValidator, NotationType,
@@ -35,7 +37,6 @@ from expression_converter import (
     postfix_to_infix, postfix_to_prefix,
     prefix_to_infix, prefix_to_postfix
 )
-from gui.main_window import MainWindow
 
 
 def print_header():
@@ -64,46 +65,51 @@ def run_cli_demo():
     validator = ExpressionValidator()
     converter = ExpressionConverter()
     
-    print("-" * 65)
-    print("Demo CLI - Validasi dan Konversi")
-    print("-" * 65)
-    print()
-    
-    # Demo infix
-    print("[1] Infix Expression: (3+4)*2")
-    result = validate_infix("(3+4)*2")
-    print(f"    Valid: {result.is_valid}")
-    print(f"    Message: {result.message}")
-    print(f"    → Postfix: {infix_to_postfix('(3+4)*2')}")
-    print(f"    → Prefix:  {infix_to_prefix('(3+4)*2')}")
-    print()
-    
-    # Demo postfix
-    print("[2] Postfix Expression: 3 4 + 2 *")
-    result = validate_postfix("3 4 + 2 *")
-    print(f"    Valid: {result.is_valid}")
-    print(f"    Message: {result.message}")
-    print(f"    → Infix:  {postfix_to_infix('3 4 + 2 *')}")
-    print(f"    → Prefix: {postfix_to_prefix('3 4 + 2 *')}")
-    print()
-    
-    # Demo prefix
-    print("[3] Prefix Expression: * + 3 4 2")
-    result = validate_prefix("* + 3 4 2")
-    print(f"    Valid: {result.is_valid}")
-    print(f"    Message: {result.message}")
-    print(f"    → Infix:   {prefix_to_infix('* + 3 4 2')}")
-    print(f"    → Postfix: {prefix_to_postfix('* + 3 4 2')}")
-    print()
-    
-    # Demo invalid expression
-    print("[4] Invalid Infix: (3+4*2")
-    result = validate_infix("(3+4*2")
-    print(f"    Valid: {result.is_valid}")
-    print(f"    Message: {result.message}")
-    print()
+    infix_result = validate_infix("(3+4)*2")
+    postfix_result = validate_postfix("3 4 + 2 *")
+    prefix_result = validate_prefix("* + 3 4 2")
+    invalid_result = validate_infix("(3+4*2")
     
-    print("-" * 65)
+    rule = "-" * 65
+    lines = [
+        rule,
+        "Demo CLI - Validasi dan Konversi",
+        rule,
+        "",
+        
+        # Demo infix
+        "[1] Infix Expression: (3+4)*2",
+        f"    Valid: {infix_result.is_valid}",
+        f"    Message: {infix_result.message}",
+        f"    → Postfix: {infix_to_postfix('(3+4)*2')}",
+        f"    → Prefix:  {infix_to_prefix('(3+4)*2')}",
+        "",
+        
+        # Demo postfix
+        "[2] Postfix Expression: 3 4 + 2 *",
+        f"    Valid: {postfix_result.is_valid}",
+        f"    Message: {postfix_result.message}",
+        f"    → Infix:  {postfix_to_infix('3 4 + 2 *')}",
+        f"    → Prefix: {postfix_to_prefix('3 4 + 2 *')}",
+        "",
+        
+        # Demo prefix
+        "[3] Prefix Expression: * + 3 4 2",
+        f"    Valid: {prefix_result.is_valid}",
+        f"    Message: {prefix_result.message}",
+        f"    → Infix:   {prefix_to_infix('* + 3 4 2')}",
+        f"    → Postfix: {prefix_to_postfix('* + 3 4 2')}",
+        "",
+        
+        # Demo invalid expression
+        "[4] Invalid Infix: (3+4*2",
+        f"    Valid: {invalid_result.is_valid}",
+        f"    Message: {invalid_result.message}",
+        "",
+        
+        rule,
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -118,8 +124,9 @@ def main():
     print("(Tekan ESC untuk keluar)")
     print()
     
-    # Run GUI
+    # Run GUI; pygame is only imported once the GUI is actually started
     try:
+        from gui.main_window import MainWindow
         window = MainWindow()
         window.run()
     except Exception as e:
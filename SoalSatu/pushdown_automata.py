@@ -14,10 +14,21 @@ A PDA is formally defined as a 7-tuple (Q, Σ, Γ, δ, q0, Z0, F) where:
 - F = set of accepting states
 """
 
-from typing import Dict, List, Optional, Tuple, Callable, Any
-from dataclasses import dataclass, field
+import sys
+import types
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Tuple, Callable, Any
 from enum import Enum, auto
 
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    # Numba (and numpy) are optional; the compiled run loop then runs as
+    # plain Python over lists
+    np = None
+    njit = None
+
 
 class StateType(Enum):
     """Enumeration of state types in the PDA."""
@@ -27,7 +38,104 @@ class StateType(Enum):
     ERROR = auto()
 
 
-@dataclass
+# Stack action opcodes, parsed once from PDATransition.stack_action
+_OP_INVALID = -1
+_OP_NONE = 0
+_OP_PUSH = 1
+_OP_POP = 2
+_OP_REPLACE = 3
+
+
+def _parse_stack_action(action: str) -> Tuple[int, Optional[str]]:
+    """
+    Split a stack action string into an opcode and its symbol, if any.
+    
+    The symbol is interned, so every copy of it on a stack is the same
+    object and compares by identity in transition lookups.
+    """
+    if action == "none":
+        return _OP_NONE, None
+    if action.startswith("push:"):
+        return _OP_PUSH, sys.intern(action[5:])
+    if action == "pop":
+        return _OP_POP, None
+    if action.startswith("replace:"):
+        return _OP_REPLACE, sys.intern(action[8:])
+    return _OP_INVALID, None
+
+
+# Outcomes of _run_table
+_RUN_OK = 0
+_RUN_NO_TRANSITION = 1
+_RUN_STACK_FAILED = 2
+
+
+def _run_table(input_ids, start, end, next_state, action_op, action_arg,
+               n_symbols, n_stack_symbols, initial_state, stack):
+    """
+    Run a PDA compiled by PushdownAutomata.compile over input_ids[start:end].
+    
+    The tables are flat arrays indexed by (state, symbol, stack_top), with
+    next_state -1 where no transition applies. stack is a scratch buffer of
+    at least end - start + 2 entries; entry 0 is the bottom marker.
+    
+    Returns:
+        (outcome, state, position, stack_top): the state and stack top when
+        the run stopped, and the index of the symbol it stopped at
+    """
+    state = initial_state
+    stack[0] = 0
+    top = 0
+    for i in range(start, end):
+        cell = (state * n_symbols + input_ids[i]) * n_stack_symbols + stack[top]
+        target = next_state[cell]
+        if target == -1:
+            return _RUN_NO_TRANSITION, state, i, int(stack[top])
+        op = action_op[cell]
+        if op == _OP_PUSH:
+            top += 1
+            stack[top] = action_arg[cell]
+        elif op == _OP_POP:
+            if top == 0:
+                return _RUN_STACK_FAILED, state, i, int(stack[top])
+            top -= 1
+        elif op == _OP_REPLACE:
+            # PDAStack.pop keeps the bottom marker, so replacing it pushes
+            if top == 0:
+                top = 1
+            stack[top] = action_arg[cell]
+        elif op != _OP_NONE:
+            return _RUN_STACK_FAILED, state, i, int(stack[top])
+        state = target
+    return _RUN_OK, state, end, int(stack[top])
+
+
+def _run_batch(input_ids, offsets, next_state, action_op, action_arg,
+               n_symbols, n_stack_symbols, initial_state, accepting, stack, accepted):
+    """
+    Run _run_table over each input_ids[offsets[k]:offsets[k + 1]].
+    
+    accepted[k] is set to 1 when input k ends without error in a state
+    flagged in accepting, else 0. stack must fit the longest input.
+    """
+    for k in range(len(offsets) - 1):
+        outcome, state, position, top = _run_table(
+            input_ids, offsets[k], offsets[k + 1], next_state, action_op, action_arg,
+            n_symbols, n_stack_symbols, initial_state, stack)
+        accepted[k] = 1 if outcome == _RUN_OK and accepting[state] != 0 else 0
+
+
+if njit is not None:
+    # Explicit signatures compile at import; cache=True keeps the machine
+    # code on disk between runs. _run_batch calls the compiled _run_table,
+    # so it has to be wrapped second.
+    _run_table = njit("UniTuple(int64, 4)(int32[::1], int64, int64, int32[::1], int32[::1], "
+                      "int32[::1], int64, int64, int64, int32[::1])", cache=True)(_run_table)
+    _run_batch = njit("void(int32[::1], int64[::1], int32[::1], int32[::1], int32[::1], "
+                      "int64, int64, int64, int32[::1], int32[::1], uint8[::1])",
+                      cache=True)(_run_batch)
+
+
 class PDAState:
     """
     Represents a state in the Pushdown Automata.
@@ -36,21 +144,28 @@ class PDAState:
         name: Unique identifier for the state
         state_type: Type of state (initial, normal, accepting, error)
         description: Human-readable description of the state
+    
+    States are compared by identity: a PDA creates each one once in
+    add_state and every transition refers to that same object.
     """
-    name: str
-    state_type: StateType = StateType.NORMAL
-    description: str = ""
+    # Explicit slots; dataclass fields with defaults can't be combined with
+    # __slots__ before Python 3.10
+    __slots__ = ('name', 'state_type', 'description', 'is_initial', 'is_accepting')
     
-    def __hash__(self):
-        return hash(self.name)
+    def __init__(self, name: str, state_type: StateType = StateType.NORMAL,
+                 description: str = ""):
+        self.name = name
+        self.state_type = state_type
+        self.description = description
+        # Set by PushdownAutomata.add_state on the PDA's initial state
+        self.is_initial = False
+        self.is_accepting = state_type == StateType.ACCEPTING
     
-    def __eq__(self, other):
-        if isinstance(other, PDAState):
-            return self.name == other.name
-        return False
+    def __repr__(self) -> str:
+        return (f"PDAState(name={self.name!r}, state_type={self.state_type!r}, "
+                f"description={self.description!r})")
 
 
-@dataclass
 class PDATransition:
     """
     Represents a transition in the PDA.
@@ -64,17 +179,49 @@ class PDATransition:
     - Moving to to_state
     - Performing stack_action on the stack
     """
-    from_state: PDAState
-    to_state: PDAState
-    input_symbol: Optional[str]  # None for epsilon transition
-    stack_top: Optional[str]     # None for any stack top
-    stack_action: str            # 'push:X', 'pop', 'none', or 'replace:X'
-    description: str = ""
+    __slots__ = ('from_state', 'to_state', 'input_symbol', 'stack_top',
+                 'stack_action', 'description', 'action_op', 'action_sym',
+                 'input_display', 'stack_top_display', 'label')
+    
+    def __init__(self, from_state: PDAState, to_state: PDAState,
+                 input_symbol: Optional[str],  # None for epsilon transition
+                 stack_top: Optional[str],     # None for any stack top
+                 stack_action: str,            # 'push:X', 'pop', 'none', or 'replace:X'
+                 description: str = ""):
+        self.from_state = from_state
+        self.to_state = to_state
+        self.input_symbol = input_symbol
+        self.stack_top = stack_top
+        self.stack_action = stack_action
+        self.description = description
+        # stack_action, parsed once
+        self.action_op, self.action_sym = _parse_stack_action(stack_action)
+        # Display strings for diagrams
+        self.input_display = input_symbol or 'ε'
+        self.stack_top_display = stack_top or 'any'
+        self.label = f"{self.input_display}, {self.stack_top_display} → {stack_action}"
+    
+    def _fields(self) -> tuple:
+        return (self.from_state, self.to_state, self.input_symbol,
+                self.stack_top, self.stack_action, self.description)
+    
+    def __eq__(self, other):
+        if isinstance(other, PDATransition):
+            return self._fields() == other._fields()
+        return NotImplemented
+    
+    # Mutable and compared by value, so not hashable
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        return (f"PDATransition(from_state={self.from_state!r}, to_state={self.to_state!r}, "
+                f"input_symbol={self.input_symbol!r}, stack_top={self.stack_top!r}, "
+                f"stack_action={self.stack_action!r}, description={self.description!r})")
     
     def matches(self, current_state: PDAState, input_sym: Optional[str], 
                 stack_top: Optional[str]) -> bool:
         """Check if this transition can be taken given current configuration."""
-        if self.from_state != current_state:
+        if self.from_state is not current_state:
             return False
         if self.input_symbol is not None and self.input_symbol != input_sym:
             return False
@@ -83,65 +230,116 @@ class PDATransition:
         return True
 
 
+def _replay_stack(initial_symbol: str, log: List[Tuple[str, str]],
+                  length: int) -> List[str]:
+    """Rebuild the stack contents after the first length operations of log."""
+    stack = [initial_symbol]
+    for i in range(length):
+        op, symbol = log[i]
+        if op == "push":
+            stack.append(symbol)
+        else:
+            stack.pop()
+    return stack
+
+
 class PDAStack:
     """
     Stack implementation for the Pushdown Automata.
     
     Provides standard stack operations with history tracking for visualization.
+    History is kept as a log of (op, symbol) operations; stack snapshots are
+    rebuilt from it only when asked for.
+    
+    The symbols live in a preallocated buffer with an index to the top, so
+    pushes and pops don't resize a list; the buffer doubles when full.
     """
     
+    INITIAL_CAPACITY = 1024
+    
     def __init__(self, initial_symbol: str = "Z0"):
         """Initialize stack with bottom marker."""
-        self._stack: List[str] = [initial_symbol]
-        self._history: List[Tuple[str, List[str]]] = []  # (action, stack_state)
+        self._buf: List[Optional[str]] = [None] * self.INITIAL_CAPACITY
+        self._buf[0] = initial_symbol
+        self._top = 0  # index of the top symbol; 0 is the bottom marker
+        self._history: List[Tuple[str, str]] = []  # (op, symbol)
         self._initial_symbol = initial_symbol
     
     def push(self, symbol: str) -> None:
         """Push a symbol onto the stack."""
-        self._stack.append(symbol)
-        self._history.append(("push:" + symbol, self._stack.copy()))
+        top = self._top + 1
+        buf = self._buf
+        if top == len(buf):
+            buf.extend([None] * len(buf))
+        buf[top] = symbol
+        self._top = top
+        self._history.append(("push", symbol))
     
     def pop(self) -> Optional[str]:
         """Pop and return the top symbol, or None if only bottom marker remains."""
-        if len(self._stack) > 1:
-            symbol = self._stack.pop()
-            self._history.append(("pop:" + symbol, self._stack.copy()))
+        top = self._top
+        if top > 0:
+            symbol = self._buf[top]
+            self._top = top - 1
+            self._history.append(("pop", symbol))
             return symbol
         return None
     
     def peek(self) -> Optional[str]:
         """Return the top symbol without removing it."""
-        return self._stack[-1] if self._stack else None
+        return self._buf[self._top]
     
     def is_empty(self) -> bool:
         """Check if stack only contains the bottom marker."""
-        return len(self._stack) <= 1
+        return self._top == 0
     
     def size(self) -> int:
         """Return number of elements (excluding bottom marker)."""
-        return len(self._stack) - 1
+        return self._top
     
     def clear(self) -> None:
         """Reset stack to initial state."""
-        self._stack = [self._initial_symbol]
+        # The buffer is kept; entries above the top are simply overwritten
+        self._buf[0] = self._initial_symbol
+        self._top = 0
+        # A fresh list, so checkpoints taken before the reset stay valid
         self._history = []
     
     def get_contents(self) -> List[str]:
-        """Return copy of current stack contents."""
-        return self._stack.copy()
+        """
+        Return copy of current stack contents.
+        
+        Prefer get_contents_view() when the result is only read.
+        """
+        return self._buf[:self._top + 1]
+    
+    def get_contents_view(self) -> Tuple[str, ...]:
+        """Return current stack contents as an immutable tuple, bottom first."""
+        return tuple(self._buf[:self._top + 1])
+    
+    def checkpoint(self) -> Tuple[str, List[Tuple[str, str]], int]:
+        """Return a cheap reference to the current contents for _replay_stack."""
+        return self._initial_symbol, self._history, len(self._history)
     
     def get_history(self) -> List[Tuple[str, List[str]]]:
-        """Return history of stack operations."""
-        return self._history.copy()
+        """Return history of stack operations as (action, stack_state) pairs."""
+        history = []
+        stack = [self._initial_symbol]
+        for op, symbol in self._history:
+            if op == "push":
+                stack.append(symbol)
+            else:
+                stack.pop()
+            history.append((op + ":" + symbol, stack.copy()))
+        return history
     
     def __str__(self) -> str:
-        return f"Stack: {self._stack}"
+        return f"Stack: {self.get_contents()}"
     
     def __repr__(self) -> str:
-        return f"PDAStack({self._stack})"
+        return f"PDAStack({self.get_contents()})"
 
 
-@dataclass
 class PDAConfiguration:
     """
     Represents an instantaneous description (ID) of the PDA.
@@ -150,13 +348,46 @@ class PDAConfiguration:
     - q is the current state
     - w is the remaining input
     - γ is the current stack contents
+    
+    The stack contents can be given directly or as a PDAStack.checkpoint(),
+    in which case they are only rebuilt when first read.
     """
-    state: PDAState
-    remaining_input: str
-    stack_contents: List[str]
+    __slots__ = ('state', 'remaining_input', '_stack_contents', '_checkpoint')
+    
+    def __init__(self, state: PDAState, remaining_input: str,
+                 stack_contents: Optional[List[str]] = None,
+                 checkpoint: Optional[Tuple[str, List[Tuple[str, str]], int]] = None):
+        self.state = state
+        self.remaining_input = remaining_input
+        self._stack_contents = stack_contents
+        self._checkpoint = checkpoint
+    
+    @property
+    def stack_contents(self) -> List[str]:
+        if self._stack_contents is None:
+            self._stack_contents = _replay_stack(*self._checkpoint)
+            self._checkpoint = None
+        return self._stack_contents
+    
+    @stack_contents.setter
+    def stack_contents(self, stack_contents: List[str]) -> None:
+        self._stack_contents = stack_contents
+        self._checkpoint = None
+    
+    def __eq__(self, other):
+        if isinstance(other, PDAConfiguration):
+            return (self.state == other.state
+                    and self.remaining_input == other.remaining_input
+                    and self.stack_contents == other.stack_contents)
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return (f"PDAConfiguration(state={self.state!r}, "
+                f"remaining_input={self.remaining_input!r}, "
+                f"stack_contents={self.stack_contents!r})")
     
     def __str__(self) -> str:
-        stack_str = ''.join(reversed(self.stack_contents))
+        stack_str = ''.join(self.stack_contents[::-1])
         return f"({self.state.name}, {self.remaining_input or 'ε'}, {stack_str})"
 
 
@@ -168,9 +399,17 @@ class PushdownAutomata:
     states and transitions for different validation tasks.
     """
     
-    def __init__(self, name: str = "PDA"):
-        """Initialize an empty PDA."""
+    def __init__(self, name: str = "PDA", history_limit: Optional[int] = None):
+        """
+        Initialize an empty PDA.
+        
+        history_limit bounds how many recent configurations and transitions
+        are kept while processing; None keeps all of them.
+        """
         self.name = name
+        self.history_limit = history_limit
+        # Whether step() records configurations and transitions
+        self.track_history = True
         self.states: Dict[str, PDAState] = {}
         self.transitions: List[PDATransition] = []
         self.initial_state: Optional[PDAState] = None
@@ -180,16 +419,43 @@ class PushdownAutomata:
         self.stack_alphabet: set = {"Z0"}
         
         # For tracking execution
-        self._execution_history: List[PDAConfiguration] = []
-        self._transition_history: List[PDATransition] = []
+        self._execution_history: Deque[PDAConfiguration] = deque(maxlen=history_limit)
+        self._transition_history: Deque[PDATransition] = deque(maxlen=history_limit)
+        # Configurations handed back by release_history(), reused by step()
+        self._config_pool: List[PDAConfiguration] = []
+        
+        # Interned input symbols, so input can be mapped onto the same
+        # string objects the transition index is keyed with
+        self._symbol_table: Dict[str, str] = {}
+        
+        # First transition added for each (from_state, input_symbol, stack_top)
+        # pattern, with its position in self.transitions
+        self._transition_index: Dict[Tuple[str, Optional[str], Optional[str]],
+                                     Tuple[int, PDATransition]] = {}
+        
+        # Dense transition tables built by compile(); dropped, along with a
+        # specialize()d step, whenever a state or transition is added
+        self._compiled: Optional[tuple] = None
+        
+        # _lookup_transition results per (state, input_symbol, stack_top),
+        # so the steady state of step() is one dict probe
+        self._resolved: Dict[Tuple[str, Optional[str], Optional[str]],
+                             Optional[PDATransition]] = {}
+        
+        # get_diagram_data() result, rebuilt after the PDA changes
+        self._diagram_cache: Optional[Dict] = None
     
     def add_state(self, name: str, state_type: StateType = StateType.NORMAL,
                   description: str = "") -> PDAState:
         """Add a state to the PDA."""
         state = PDAState(name, state_type, description)
         self.states[name] = state
+        self._drop_compiled()
         
         if state_type == StateType.INITIAL:
+            if self.initial_state is not None:
+                self.initial_state.is_initial = False
+            state.is_initial = True
             self.initial_state = state
             self.current_state = state
         
@@ -214,6 +480,11 @@ class PushdownAutomata:
         """
         from_s = self.states[from_state]
         to_s = self.states[to_state]
+        if input_symbol is not None:
+            input_symbol = self._symbol_table.setdefault(input_symbol,
+                                                         sys.intern(input_symbol))
+        if stack_top is not None:
+            stack_top = sys.intern(stack_top)
         
         transition = PDATransition(
             from_state=from_s,
@@ -224,55 +495,109 @@ class PushdownAutomata:
             description=description
         )
         
+        self._transition_index.setdefault(
+            (from_state, input_symbol, stack_top),
+            (len(self.transitions), transition)
+        )
         self.transitions.append(transition)
+        self._drop_compiled()
         
         if input_symbol:
             self.input_alphabet.add(input_symbol)
+        if transition.action_sym is not None:
+            self.stack_alphabet.add(transition.action_sym)
         
         return transition
     
+    def _drop_compiled(self) -> None:
+        """Forget everything derived from the states and transitions."""
+        self._compiled = None
+        self._resolved = {}
+        self._diagram_cache = None
+        self.__dict__.pop('step', None)
+    
     def reset(self) -> None:
         """Reset PDA to initial configuration."""
         self.current_state = self.initial_state
         self.stack.clear()
-        self._execution_history = []
-        self._transition_history = []
+        self._execution_history = deque(maxlen=self.history_limit)
+        self._transition_history = deque(maxlen=self.history_limit)
     
-    def _execute_stack_action(self, action: str) -> bool:
-        """Execute a stack action. Returns False if action fails."""
-        if action == "none":
+    def _execute_stack_action(self, transition: PDATransition) -> bool:
+        """
+        Execute a transition's stack action. Returns False if action fails.
+        
+        This is the per-symbol hot path, so it works on the PDAStack buffer
+        directly instead of going through push() and pop(); the effect,
+        including the history log, is the same.
+        """
+        op = transition.action_op
+        if op == _OP_NONE:
+            return True
+        stack = self.stack
+        top = stack._top
+        if op == _OP_PUSH:
+            symbol = transition.action_sym
+            top += 1
+            buf = stack._buf
+            if top == len(buf):
+                buf.extend([None] * len(buf))
+            buf[top] = symbol
+            stack._top = top
+            stack._history.append(("push", symbol))
             return True
-        elif action.startswith("push:"):
-            symbol = action[5:]
-            self.stack.push(symbol)
-            self.stack_alphabet.add(symbol)
+        elif op == _OP_POP:
+            if top == 0:
+                return False
+            stack._history.append(("pop", stack._buf[top]))
+            stack._top = top - 1
             return True
-        elif action == "pop":
-            result = self.stack.pop()
-            return result is not None
-        elif action.startswith("replace:"):
-            symbol = action[8:]
-            self.stack.pop()
-            self.stack.push(symbol)
-            self.stack_alphabet.add(symbol)
+        elif op == _OP_REPLACE:
+            symbol = transition.action_sym
+            buf = stack._buf
+            if top == 0:
+                # Only the bottom marker: nothing to pop, so just push
+                top = 1
+                if top == len(buf):
+                    buf.extend([None] * len(buf))
+            else:
+                stack._history.append(("pop", buf[top]))
+            buf[top] = symbol
+            stack._top = top
+            stack._history.append(("push", symbol))
             return True
         return False
     
     def _find_transition(self, input_symbol: Optional[str]) -> Optional[PDATransition]:
-        """Find a valid transition for the current configuration."""
-        stack_top = self.stack.peek()
-        
-        for transition in self.transitions:
-            if transition.matches(self.current_state, input_symbol, stack_top):
-                return transition
+        """
+        Find a valid transition for the current configuration.
         
-        # Try epsilon transition if no match found
-        if input_symbol is not None:
-            for transition in self.transitions:
-                if transition.matches(self.current_state, None, stack_top):
-                    return transition
+        A transition matches when its input symbol and stack top are equal to
+        the current ones or None (wildcard), so at most four patterns apply.
+        Of those, the one added first wins, as with a scan of self.transitions.
+        Epsilon transitions are among the wildcard patterns, so they need no
+        separate pass. The answer for each configuration is memoized.
+        """
+        stack = self.stack
+        key = (self.current_state.name, input_symbol, stack._buf[stack._top])
+        try:
+            return self._resolved[key]
+        except KeyError:
+            transition = self._resolved[key] = self._lookup_transition(*key)
+            return transition
+    
+    def _lookup_transition(self, name: str, input_symbol: Optional[str],
+                           stack_top: Optional[str]) -> Optional[PDATransition]:
+        """Find the first transition from state name matching input and stack top."""
+        index = self._transition_index
+        best = None
+        for key in ((name, input_symbol, stack_top), (name, None, stack_top),
+                    (name, input_symbol, None), (name, None, None)):
+            entry = index.get(key)
+            if entry is not None and (best is None or entry[0] < best[0]):
+                best = entry
         
-        return None
+        return best[1] if best is not None else None
     
     def step(self, input_symbol: str) -> Tuple[bool, Optional[str]]:
         """
@@ -285,70 +610,313 @@ class PushdownAutomata:
             Tuple of (success, error_message)
         """
         # Record current configuration
-        config = PDAConfiguration(
-            state=self.current_state,
-            remaining_input=input_symbol,
-            stack_contents=self.stack.get_contents()
-        )
-        self._execution_history.append(config)
+        if self.track_history:
+            self._record_configuration(input_symbol)
         
         # Find valid transition
         transition = self._find_transition(input_symbol)
         
         if transition is None:
-            # No valid transition - go to error state if exists
-            if "q_error" in self.states:
-                self.current_state = self.states["q_error"]
-            return False, f"No valid transition for input '{input_symbol}' in state '{self.current_state.name}'"
+            return self._no_transition(input_symbol)
         
         # Execute stack action
-        if not self._execute_stack_action(transition.stack_action):
-            if "q_error" in self.states:
-                self.current_state = self.states["q_error"]
-            return False, f"Stack action '{transition.stack_action}' failed"
+        if not self._execute_stack_action(transition):
+            return self._stack_action_failed(transition)
         
         # Transition to new state
         self.current_state = transition.to_state
-        self._transition_history.append(transition)
+        if self.track_history:
+            self._transition_history.append(transition)
         
         return True, None
     
-    def process(self, input_string: str) -> Tuple[bool, str, List[PDAConfiguration]]:
+    def _record_configuration(self, input_symbol: str) -> None:
+        """Append the current configuration, reusing a released one if any."""
+        pool = self._config_pool
+        if pool:
+            config = pool.pop()
+            config.__init__(self.current_state, input_symbol,
+                            checkpoint=self.stack.checkpoint())
+        else:
+            config = PDAConfiguration(
+                state=self.current_state,
+                remaining_input=input_symbol,
+                checkpoint=self.stack.checkpoint()
+            )
+        self._execution_history.append(config)
+    
+    def _no_transition(self, input_symbol: str) -> Tuple[bool, str]:
+        """Fail a step that has no valid transition."""
+        # Go to error state if exists
+        if "q_error" in self.states:
+            self.current_state = self.states["q_error"]
+        return False, f"No valid transition for input '{input_symbol}' in state '{self.current_state.name}'"
+    
+    def _stack_action_failed(self, transition: PDATransition) -> Tuple[bool, str]:
+        """Fail a step whose transition's stack action could not be applied."""
+        if "q_error" in self.states:
+            self.current_state = self.states["q_error"]
+        return False, f"Stack action '{transition.stack_action}' failed"
+    
+    def specialize(self) -> None:
+        """
+        Replace step() on this PDA with one generated for its transitions.
+        
+        The generated step dispatches on the current state by identity, then
+        tests each of that state's transitions in order with inline
+        comparisons and stack calls, so no transition lookup or action
+        dispatch happens per symbol. History and error handling are the same
+        as step(). Adding a state or transition reverts to the generic step.
+        """
+        by_state: Dict[int, Tuple[PDAState, List[int]]] = {}
+        for i, t in enumerate(self.transitions):
+            by_state.setdefault(id(t.from_state), (t.from_state, []))[1].append(i)
+        
+        namespace = {}
+        lines = [
+            "def step(self, input_symbol):",
+            "    stack = self.stack",
+            "    state = self.current_state",
+            "    track_history = self.track_history",
+            "    if track_history:",
+            "        self._record_configuration(input_symbol)",
+            "    top = stack.peek()",
+        ]
+        for n, (state, indices) in enumerate(by_state.values()):
+            namespace[f"S{n}"] = state
+            lines.append(f"    {'if' if n == 0 else 'elif'} state is S{n}:")
+            for i in indices:
+                t = self.transitions[i]
+                namespace[f"T{i}"] = t
+                namespace[f"N{i}"] = t.to_state
+                conditions = []
+                if t.input_symbol is not None:
+                    conditions.append(f"input_symbol == {t.input_symbol!r}")
+                if t.stack_top is not None:
+                    conditions.append(f"top == {t.stack_top!r}")
+                indent = "        "
+                if conditions:
+                    lines.append(indent + "if " + " and ".join(conditions) + ":")
+                    indent += "    "
+                
+                op = t.action_op
+                if op == _OP_PUSH:
+                    lines.append(f"{indent}stack.push({t.action_sym!r})")
+                elif op == _OP_POP:
+                    lines.append(f"{indent}if stack.pop() is None:")
+                    lines.append(f"{indent}    return self._stack_action_failed(T{i})")
+                elif op == _OP_REPLACE:
+                    lines.append(f"{indent}stack.pop()")
+                    lines.append(f"{indent}stack.push({t.action_sym!r})")
+                if op == _OP_INVALID:
+                    lines.append(f"{indent}return self._stack_action_failed(T{i})")
+                else:
+                    lines.append(f"{indent}self.current_state = N{i}")
+                    lines.append(f"{indent}if track_history:")
+                    lines.append(f"{indent}    self._transition_history.append(T{i})")
+                    lines.append(f"{indent}return True, None")
+                
+                # An unconditional transition shadows the rest of this state's
+                if not conditions:
+                    break
+        lines.append("    return self._no_transition(input_symbol)")
+        
+        exec(compile("\n".join(lines), f"<{self.name} step>", "exec"), namespace)
+        self.step = types.MethodType(namespace['step'], self)
+    
+    def process(self, input_string: str,
+                track_history: bool = True) -> Tuple[bool, str, List[PDAConfiguration]]:
         """
         Process an entire input string.
         
         Args:
             input_string: The string to process
+            track_history: Record configurations and transitions; when False
+                only the verdict is computed and the history comes back empty
             
         Returns:
             Tuple of (accepted, message, execution_history)
         """
+        previous = self.track_history
+        self.track_history = track_history
+        try:
+            accepted, message = self._run(input_string)
+        finally:
+            self.track_history = previous
+        return accepted, message, list(self._execution_history)
+    
+    def _run(self, input_string: str) -> Tuple[bool, str]:
+        """Reset, step through input_string and return (accepted, message)."""
         self.reset()
         
-        for symbol in input_string:
-            success, error = self.step(symbol)
+        # Symbols are mapped as they are read, so a run that fails early
+        # never touches the rest of the input
+        symbol_table = self._symbol_table
+        step = self.step
+        for c in input_string:
+            success, error = step(symbol_table.get(c, c))
             if not success:
-                return False, error, self._execution_history
+                return False, error
         
         # Check final state
         if self.current_state.state_type == StateType.ACCEPTING:
-            return True, "Input accepted", self._execution_history
+            return True, "Input accepted"
         elif self.current_state.state_type == StateType.ERROR:
-            return False, "Ended in error state", self._execution_history
+            return False, "Ended in error state"
+        else:
+            return False, f"Ended in non-accepting state '{self.current_state.name}'"
+    
+    def compile(self) -> None:
+        """
+        Build dense integer transition tables for process_fast().
+        
+        States, input symbols and stack symbols get contiguous ids; input
+        symbols outside the alphabet share one extra id that only wildcard
+        transitions match. Each (state, symbol, stack_top) cell holds the
+        transition _find_transition would pick, so both paths agree.
+        """
+        state_names = list(self.states)
+        state_ids = {name: i for i, name in enumerate(state_names)}
+        symbols = list(self._symbol_table)
+        symbol_ids = {symbol: i for i, symbol in enumerate(symbols)}
+        stack_symbols = ["Z0"] + sorted(self.stack_alphabet - {"Z0"})
+        for t in self.transitions:
+            if t.stack_top is not None and t.stack_top not in stack_symbols:
+                stack_symbols.append(t.stack_top)
+        stack_ids = {symbol: i for i, symbol in enumerate(stack_symbols)}
+        
+        # The last symbol column stands for anything outside the alphabet
+        n_symbols = len(symbols) + 1
+        n_stack_symbols = len(stack_symbols)
+        size = len(state_names) * n_symbols * n_stack_symbols
+        next_state = [-1] * size
+        action_op = [_OP_NONE] * size
+        action_arg = [0] * size
+        cell = 0
+        for name in state_names:
+            for input_symbol in symbols + [None]:
+                for stack_top in stack_symbols:
+                    t = self._lookup_transition(name, input_symbol, stack_top)
+                    if t is not None:
+                        next_state[cell] = state_ids[t.to_state.name]
+                        action_op[cell] = t.action_op
+                        if t.action_sym is not None:
+                            action_arg[cell] = stack_ids[t.action_sym]
+                    cell += 1
+        
+        accepting = [int(self.states[name].state_type == StateType.ACCEPTING)
+                     for name in state_names]
+        
+        if np is not None:
+            next_state = np.array(next_state, dtype=np.int32)
+            action_op = np.array(action_op, dtype=np.int32)
+            action_arg = np.array(action_arg, dtype=np.int32)
+            accepting = np.array(accepting, dtype=np.int32)
+        self._compiled = (state_names, state_ids[self.initial_state.name],
+                          symbol_ids, stack_symbols, next_state, action_op, action_arg,
+                          accepting)
+    
+    def process_fast(self, input_string: str) -> Tuple[bool, str]:
+        """
+        Decide whether input_string is accepted, without recording history.
+        
+        Runs the tables from compile() (built on first use) through a loop
+        that Numba compiles when installed. The result and message match
+        process(); the PDA's own state and stack are left untouched.
+        """
+        if self._compiled is None:
+            self.compile()
+        (state_names, initial_id, symbol_ids, stack_symbols,
+         next_state, action_op, action_arg, _) = self._compiled
+        
+        other = len(symbol_ids)
+        input_ids = [symbol_ids.get(c, other) for c in input_string]
+        if np is not None:
+            input_ids = np.array(input_ids, dtype=np.int32)
+            stack = np.zeros(len(input_string) + 2, dtype=np.int32)
         else:
-            return False, f"Ended in non-accepting state '{self.current_state.name}'", self._execution_history
+            stack = [0] * (len(input_string) + 2)
+        outcome, state_id, position, top_id = _run_table(
+            input_ids, 0, len(input_string), next_state, action_op, action_arg,
+            other + 1, len(stack_symbols), initial_id, stack
+        )
+        
+        state = self.states[state_names[state_id]]
+        if outcome == _RUN_NO_TRANSITION:
+            if "q_error" in self.states:
+                state = self.states["q_error"]
+            return False, f"No valid transition for input '{input_string[position]}' in state '{state.name}'"
+        if outcome == _RUN_STACK_FAILED:
+            transition = self._lookup_transition(state.name, input_string[position],
+                                                 stack_symbols[top_id])
+            return False, f"Stack action '{transition.stack_action}' failed"
+        
+        if state.state_type == StateType.ACCEPTING:
+            return True, "Input accepted"
+        elif state.state_type == StateType.ERROR:
+            return False, "Ended in error state"
+        else:
+            return False, f"Ended in non-accepting state '{state.name}'"
+    
+    def process_batch(self, inputs: Iterable[str]) -> List[bool]:
+        """
+        Decide acceptance for many input strings at once.
+        
+        After compile(), all inputs are packed into one id array with offsets
+        and run through the compiled loop in a single call. Otherwise each
+        input goes through process() without recording history.
+        """
+        inputs = list(inputs)
+        if self._compiled is None:
+            previous = self.track_history
+            self.track_history = False
+            try:
+                return [self._run(input_string)[0] for input_string in inputs]
+            finally:
+                self.track_history = previous
+        
+        (state_names, initial_id, symbol_ids, stack_symbols,
+         next_state, action_op, action_arg, accepting) = self._compiled
+        other = len(symbol_ids)
+        input_ids = [symbol_ids.get(c, other) for input_string in inputs for c in input_string]
+        offsets = [0]
+        for input_string in inputs:
+            offsets.append(offsets[-1] + len(input_string))
+        longest = max(map(len, inputs), default=0)
+        if np is not None:
+            input_ids = np.array(input_ids, dtype=np.int32)
+            offsets = np.array(offsets, dtype=np.int64)
+            stack = np.zeros(longest + 2, dtype=np.int32)
+            accepted = np.zeros(len(inputs), dtype=np.uint8)
+        else:
+            stack = [0] * (longest + 2)
+            accepted = [0] * len(inputs)
+        _run_batch(input_ids, offsets, next_state, action_op, action_arg,
+                   other + 1, len(stack_symbols), initial_id, accepting, stack, accepted)
+        return [bool(flag) for flag in accepted]
     
     def is_accepting(self) -> bool:
         """Check if current state is an accepting state."""
         return self.current_state and self.current_state.state_type == StateType.ACCEPTING
     
+    def release_history(self) -> None:
+        """
+        Hand the recorded configurations back for reuse by later steps.
+        
+        Saves allocating a configuration per symbol across repeated runs.
+        Configurations obtained from this PDA before the call (including
+        those returned by process()) must not be used afterwards.
+        """
+        self._config_pool.extend(self._execution_history)
+        self._execution_history.clear()
+    
     def get_execution_history(self) -> List[PDAConfiguration]:
         """Return the execution history."""
-        return self._execution_history.copy()
+        return list(self._execution_history)
     
     def get_transition_history(self) -> List[PDATransition]:
         """Return the transition history."""
-        return self._transition_history.copy()
+        return list(self._transition_history)
     
     def get_current_configuration(self) -> PDAConfiguration:
         """Get current PDA configuration."""
@@ -362,17 +930,23 @@ class PushdownAutomata:
         """
         Generate data for creating automata diagram.
         
+        The result is cached until a state or transition is added, so callers
+        share it and must not modify it.
+        
         Returns:
             Dictionary containing states and transitions for visualization
         """
+        if self._diagram_cache is not None:
+            return self._diagram_cache
+        
         states_data = []
         for name, state in self.states.items():
             states_data.append({
                 'name': name,
                 'type': state.state_type.name,
                 'description': state.description,
-                'is_initial': state == self.initial_state,
-                'is_accepting': state.state_type == StateType.ACCEPTING
+                'is_initial': state.is_initial,
+                'is_accepting': state.is_accepting
             })
         
         transitions_data = []
@@ -380,19 +954,20 @@ class PushdownAutomata:
             transitions_data.append({
                 'from': t.from_state.name,
                 'to': t.to_state.name,
-                'input': t.input_symbol or 'ε',
-                'stack_top': t.stack_top or 'any',
+                'input': t.input_display,
+                'stack_top': t.stack_top_display,
                 'action': t.stack_action,
-                'label': f"{t.input_symbol or 'ε'}, {t.stack_top or 'any'} → {t.stack_action}"
+                'label': t.label
             })
         
-        return {
+        self._diagram_cache = {
             'name': self.name,
             'states': states_data,
             'transitions': transitions_data,
             'input_alphabet': list(self.input_alphabet),
             'stack_alphabet': list(self.stack_alphabet)
         }
+        return self._diagram_cache
     
     def __str__(self) -> str:
         return f"PDA '{self.name}': {len(self.states)} states, {len(self.transitions)} transitions"